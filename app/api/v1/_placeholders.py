@@ -0,0 +1,45 @@
+"""
+Placeholder routers for API modules that are not implemented yet.
+
+Each entry in PLACEHOLDERS builds one small router with a single root
+endpoint; keeping them in one table avoids a module import and an
+APIRouter construction per placeholder. Once a module grows real
+endpoints it graduates back into its own file.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Response
+
+from app.api.v1.responses import precompute_static, static_response
+
+# (attribute name, tags, root message); prefixes are owned by api.py so the
+# mount point is not duplicated into the compiled route paths
+PLACEHOLDERS = (
+    ("auth", ["authentication"], "Authentication API"),
+    ("users", ["users"], "Users API"),
+    ("stocks", ["stocks"], "Stocks API"),
+    ("websocket", ["websocket"], "WebSocket API"),
+)
+
+# TODO: Add authentication endpoints (login, register, refresh, logout)
+# TODO: Add user management endpoints (me, {user_id})
+# TODO: Add stock data endpoints (search, {symbol}, history, price)
+# TODO: Add WebSocket endpoints (stocks/{symbol}, portfolio/{user_id})
+
+
+def _build_router(name: str, tags: List[str], message: str) -> APIRouter:
+    """Build a placeholder router with a single pre-serialized root endpoint"""
+    router = APIRouter(tags=tags)
+    body, headers = precompute_static({"message": message})
+
+    @router.get("/", name=f"{name}_root")
+    async def placeholder_root() -> Response:
+        return static_response(body, headers)
+
+    return router
+
+
+# Expose each placeholder router as a module attribute (auth, users, ...)
+for _name, _tags, _message in PLACEHOLDERS:
+    globals()[_name] = _build_router(_name, _tags, _message)
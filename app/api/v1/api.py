@@ -2,61 +2,61 @@
 Main API router that includes all sub-routers
 """
 
-from fastapi import APIRouter
+import importlib
 
-from app.api.v1 import auth, stocks, users, websocket, test_metrics, simple_test
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 
-# Create main API router
-api_router = APIRouter()
+from app.api.v1.responses import precompute_static, static_response
+from app.core.config import settings
 
-# Include all sub-routers
-api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["Authentication"]
-)
 
-api_router.include_router(
-    users.router,
-    prefix="/users",
-    tags=["Users"]
-)
+def _generate_route_id(route: APIRoute) -> str:
+    """Generate stable operation IDs once per route instead of FastAPI's default recomputation"""
+    tag = str(route.tags[0]) if route.tags else "api"
+    return f"{tag}-{route.name}"
 
-api_router.include_router(
-    stocks.router,
-    prefix="/stocks",
-    tags=["Stocks"]
-)
 
-api_router.include_router(
-    websocket.router,
-    prefix="/ws",
-    tags=["WebSocket"]
+# Create main API router
+api_router = APIRouter(
+    default_response_class=ORJSONResponse,
+    generate_unique_id_function=_generate_route_id,
 )
 
-api_router.include_router(
-    test_metrics.router,
-    prefix="/test",
-    tags=["Test Metrics"]
+# Sub-routers are imported lazily from this table so disabled features never
+# pay their import cost: (module path, attribute, prefix, tags, feature flag)
+_SUB_ROUTERS = (
+    ("app.api.v1._placeholders", "auth", "/auth", ["Authentication"], "FEATURE_USER_AUTHENTICATION"),
+    ("app.api.v1._placeholders", "users", "/users", ["Users"], "FEATURE_USER_AUTHENTICATION"),
+    ("app.api.v1._placeholders", "stocks", "/stocks", ["Stocks"], None),
+    ("app.api.v1._placeholders", "websocket", "/ws", ["WebSocket"], "FEATURE_WEBSOCKET_ENABLED"),
+    ("app.api.v1.test_metrics", "router", "/test", ["Test Metrics"], None),
+    ("app.api.v1.simple_test", "router", "/debug", ["Debug"], None),
 )
 
-api_router.include_router(
-    simple_test.router,
-    prefix="/debug",
-    tags=["Debug"]
-)
+# Include all sub-routers
+for _module_path, _attr, _prefix, _tags, _feature_flag in _SUB_ROUTERS:
+    if _feature_flag and not getattr(settings, _feature_flag):
+        continue
+    _module = importlib.import_module(_module_path)
+    api_router.include_router(getattr(_module, _attr), prefix=_prefix, tags=_tags)
+
+# Health check payload never changes, so serialize it once at import time
+_API_HEALTH_BODY, _API_HEALTH_HEADERS = precompute_static({
+    "status": "healthy",
+    "api_version": "v1",
+    "endpoints": [
+        "/auth",
+        "/users",
+        "/stocks",
+        "/ws"
+    ]
+})
+
 
 # Health check endpoint for API
 @api_router.get("/health")
-async def api_health_check():
+async def api_health_check() -> Response:
     """API health check endpoint"""
-    return {
-        "status": "healthy",
-        "api_version": "v1",
-        "endpoints": [
-            "/auth",
-            "/users", 
-            "/stocks",
-            "/ws"
-        ]
-    }
+    return static_response(_API_HEALTH_BODY, _API_HEALTH_HEADERS)
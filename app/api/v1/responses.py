@@ -0,0 +1,24 @@
+"""
+Helpers for pre-serialized static API responses
+"""
+
+import zlib
+from typing import Any, Dict, Tuple
+
+import orjson
+from fastapi import Response
+
+
+def precompute_static(payload: Any, max_age: int = 30) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a constant payload once and build its caching headers"""
+    body = orjson.dumps(payload)
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}",
+        "ETag": f'"{zlib.crc32(body):08x}"',
+    }
+    return body, headers
+
+
+def static_response(body: bytes, headers: Dict[str, str]) -> Response:
+    """Build a response around a pre-serialized body and precomputed headers"""
+    return Response(content=body, media_type="application/json", headers=headers)
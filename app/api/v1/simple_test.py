@@ -2,11 +2,16 @@
 Simple test endpoint for debugging
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.api.v1.responses import precompute_static, static_response
 
 router = APIRouter()
 
+# Constant payload, serialized once at import time
+_SIMPLE_BODY, _SIMPLE_HEADERS = precompute_static({"message": "Simple test endpoint works!"})
+
 @router.get("/simple")
-async def simple_test():
+async def simple_test() -> Response:
     """Simple test endpoint"""
-    return {"message": "Simple test endpoint works!"}
+    return static_response(_SIMPLE_BODY, _SIMPLE_HEADERS)
@@ -2,27 +2,34 @@
 Test endpoints for generating metrics
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.api.v1.responses import precompute_static, static_response
 
 router = APIRouter()
 
+# Constant payloads, serialized once at import time
+_SUMMARY_BODY, _SUMMARY_HEADERS = precompute_static({
+    "message": "Current metrics summary",
+    "endpoints": {
+        "health": "/health",
+        "metrics": "/metrics",
+        "docs": "/docs"
+    },
+    "test_endpoints": {
+        "summary": "/api/v1/test/summary",
+        "simple": "/api/v1/debug/simple"
+    }
+})
+
+_PING_BODY, _PING_HEADERS = precompute_static({"message": "pong", "status": "ok"})
+
 @router.get("/summary")
-async def metrics_summary():
+async def metrics_summary() -> Response:
     """Get a summary of current metrics values"""
-    return {
-        "message": "Current metrics summary",
-        "endpoints": {
-            "health": "/health",
-            "metrics": "/metrics",
-            "docs": "/docs"
-        },
-        "test_endpoints": {
-            "summary": "/api/v1/test/summary",
-            "simple": "/api/v1/debug/simple"
-        }
-    }
+    return static_response(_SUMMARY_BODY, _SUMMARY_HEADERS)
 
 @router.get("/ping")
-async def ping():
+async def ping() -> Response:
     """Simple ping endpoint"""
-    return {"message": "pong", "status": "ok"}
+    return static_response(_PING_BODY, _PING_HEADERS)
@@ -0,0 +1,57 @@
+"""
+Redis-backed JSON cache with graceful fallback to the database
+"""
+
+from typing import Any, Optional
+
+import orjson
+import redis
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# Synchronous pool, separate from the asyncio pool in app.core.redis,
+# because the repository layer runs on blocking Sessions
+_pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_POOL_SIZE,
+    socket_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
+
+def _client() -> redis.Redis:
+    return redis.Redis(connection_pool=_pool)
+
+
+def get_json(key: str) -> Optional[Any]:
+    """Fetch and decode a cached JSON value; None on miss or Redis outage"""
+    try:
+        raw = _client().get(key)
+        return orjson.loads(raw) if raw is not None else None
+    except Exception as e:
+        logger.warning("Cache read failed, falling back to database", key=key, error=str(e))
+        return None
+
+
+def set_json(key: str, value: Any, ttl: int = 600) -> None:
+    """Cache a JSON-serializable value; a Redis outage is non-fatal"""
+    try:
+        # default=float covers Decimal columns (e.g. target_price)
+        _client().set(key, orjson.dumps(value, default=float), ex=ttl)
+    except Exception as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
+
+
+def invalidate(pattern: str) -> None:
+    """Delete all keys matching a glob pattern (SCAN-based, non-blocking)"""
+    try:
+        client = _client()
+        keys = list(client.scan_iter(match=pattern, count=500))
+        if keys:
+            client.delete(*keys)
+    except Exception as e:
+        logger.warning("Cache invalidation failed", pattern=pattern, error=str(e))
@@ -3,9 +3,10 @@ Configuration management using Pydantic settings
 """
 
 import os
-from typing import List, Optional
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -36,11 +37,18 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     REDIS_PASSWORD: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
     REDIS_DB: int = Field(default=0, env="REDIS_DB")
+    # Per-process cap for each Redis connection pool, tuned independently
+    # of the Postgres pool
+    REDIS_POOL_SIZE: int = Field(default=20, env="REDIS_POOL_SIZE")
     
     # Celery Configuration
     CELERY_BROKER_URL: str = Field(default="redis://localhost:6379/1", env="CELERY_BROKER_URL")
     CELERY_RESULT_BACKEND: str = Field(default="redis://localhost:6379/1", env="CELERY_RESULT_BACKEND")
     CELERY_TASK_ALWAYS_EAGER: bool = Field(default=False, env="CELERY_TASK_ALWAYS_EAGER")
+    # Reservations each worker holds per process; short I/O-bound tasks
+    # benefit from >1 (overlaps broker fetch with execution), long-running
+    # workers can pin it back to 1 via the environment
+    CELERY_PREFETCH_MULTIPLIER: int = Field(default=4, env="CELERY_PREFETCH_MULTIPLIER")
     
     # Security Configuration
     SECRET_KEY: str = Field(
@@ -50,6 +58,9 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    # Tune against a ~100ms hash target on production hardware; passlib's
+    # default of 12 costs 3-4x that and caps login throughput accordingly
+    BCRYPT_ROUNDS: int = Field(default=10, env="BCRYPT_ROUNDS")
     
     # JWT Configuration
     JWT_SECRET_KEY: str = Field(
@@ -61,8 +72,8 @@ class Settings(BaseSettings):
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, env="JWT_REFRESH_TOKEN_EXPIRE_DAYS")
     
     # CORS Configuration
-    ALLOWED_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
+    ALLOWED_ORIGINS: Tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://localhost:8080"),
         env="ALLOWED_ORIGINS"
     )
     ALLOWED_CREDENTIALS: bool = Field(default=True, env="ALLOWED_CREDENTIALS")
@@ -78,6 +89,8 @@ class Settings(BaseSettings):
         default="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         env="SCRAPING_USER_AGENT"
     )
+    # How long historical price rows are kept before cleanup_old_data purges them
+    PRICE_RETENTION_DAYS: int = Field(default=365, env="PRICE_RETENTION_DAYS")
     
     # External APIs
     ALPHA_VANTAGE_API_KEY: Optional[str] = Field(default=None, env="ALPHA_VANTAGE_API_KEY")
@@ -122,35 +135,35 @@ class Settings(BaseSettings):
     FEATURE_USER_AUTHENTICATION: bool = Field(default=True, env="FEATURE_USER_AUTHENTICATION")
     FEATURE_ADMIN_PANEL: bool = Field(default=True, env="FEATURE_ADMIN_PANEL")
     
-    @validator("ALLOWED_ORIGINS", pre=True)
+    @field_validator("ALLOWED_ORIGINS", mode="before")
+    @classmethod
     def parse_allowed_origins(cls, v):
-        """Parse ALLOWED_ORIGINS from string to list if needed"""
+        """Parse ALLOWED_ORIGINS from string to tuple if needed"""
         if isinstance(v, str):
             # Remove brackets and quotes, split by comma
             v = v.strip("[]").replace('"', '').replace("'", "").split(",")
-            v = [origin.strip() for origin in v if origin.strip()]
+            v = tuple(origin.strip() for origin in v if origin.strip())
         return v
-    
-    @validator("SECRET_KEY")
-    def validate_secret_key(cls, v):
-        """Ensure SECRET_KEY is not the default value in production"""
-        # Skip validation during class construction to avoid recursion
-        return v
-    
-    @validator("JWT_SECRET_KEY")
-    def validate_jwt_secret_key(cls, v):
-        """Ensure JWT_SECRET_KEY is not the default value in production"""
-        # Skip validation during class construction to avoid recursion
-        return v
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached application settings instance"""
+    return Settings()
 
 
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
+
+# Frozen origin set for O(1) membership checks in hot paths
+ALLOWED_ORIGINS_SET = frozenset(settings.ALLOWED_ORIGINS)
 
 # Validate critical settings
 def validate_settings():
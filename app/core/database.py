@@ -2,26 +2,31 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 import structlog
 
 from app.core.config import settings
+from app.models.base import Base
 
-logger = structlog.get_logger()
+# Bound once at import so every lifecycle message goes through one pipeline
+logger = structlog.get_logger("database")
 
 # Database URL
 DATABASE_URL = settings.DATABASE_URL
 
-# Create engine
+# Create engine with a pool sized from settings so throughput scales with workers
 engine = create_engine(
     DATABASE_URL,
-    poolclass=StaticPool,  # For development
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
     pool_pre_ping=True,    # Verify connections before use
+    pool_recycle=1800,     # Recycle connections older than 30 minutes
+    pool_use_lifo=True,    # Reuse hot connections first
     echo=settings.DEBUG,   # Log SQL queries in debug mode
+    query_cache_size=1200, # Room for every hot statement's compiled form
 )
 
 # Create session factory
@@ -31,9 +36,6 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
-# Base class for all models
-Base = declarative_base()
-
 def get_db() -> Session:
     """Get database session"""
     db = SessionLocal()
@@ -78,7 +80,7 @@ def check_connection() -> bool:
     """Check database connection"""
     try:
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
         logger.error("Database connection failed", error=str(e))
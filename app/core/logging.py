@@ -4,35 +4,51 @@ Logging configuration using structlog
 
 import logging
 import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from app.core.config import settings
 
+# Resolve hot settings once at import time to avoid repeated Pydantic lookups
+_LOG_LEVEL_NUM = getattr(logging, settings.LOG_LEVEL.upper())
+
+
+def _orjson_dumps(value: Any, **kwargs: Any) -> str:
+    """C-speed JSON rendering for log events; default=str covers types
+    orjson doesn't know natively (Decimal, Enum members, ...)"""
+    return orjson.dumps(value, default=str).decode()
+
+# Processor chains are compiled once at import time; setup_logging picks one
+_SHARED_PROCESSORS = [
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+]
+_JSON_CHAIN = _SHARED_PROCESSORS + [structlog.processors.JSONRenderer(serializer=_orjson_dumps)]
+_CONSOLE_CHAIN = _SHARED_PROCESSORS + [structlog.dev.ConsoleRenderer()]
+
 
 def setup_logging() -> None:
     """Setup structured logging configuration"""
-    
+
     # Create logs directory if it doesn't exist
     log_file = Path(settings.LOG_FILE)
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.LOG_FORMAT == "json" else structlog.dev.ConsoleRenderer(),
-        ],
+        processors=_JSON_CHAIN if settings.LOG_FORMAT == "json" else _CONSOLE_CHAIN,
         context_class=dict,
         logger_factory=LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -43,12 +59,12 @@ def setup_logging() -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        level=_LOG_LEVEL_NUM,
     )
-    
+
     # Configure file handler
     file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
+    file_handler.setLevel(_LOG_LEVEL_NUM)
     
     # Add file handler to root logger
     logging.getLogger().addHandler(file_handler)
@@ -64,8 +80,9 @@ def setup_logging() -> None:
     logging.getLogger("playwright").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=64)
 def get_logger(name: str = None) -> structlog.BoundLogger:
-    """Get a structured logger instance"""
+    """Get a structured logger instance (memoized per name)"""
     return structlog.get_logger(name)
 
 
@@ -87,13 +104,14 @@ def log_error(error: Exception, context: Dict[str, Any] = None) -> None:
     error_data = {
         "error_type": type(error).__name__,
         "error_message": str(error),
-        "error_traceback": getattr(error, "__traceback__", None),
     }
-    
+
     if context:
         error_data.update(context)
-    
-    logger.error("Application Error", **error_data)
+
+    # Let the format_exc_info processor render the traceback; storing
+    # error.__traceback__ in the event dict pins frame objects in memory
+    logger.error("Application Error", exc_info=error, **error_data)
 
 
 def log_performance(operation: str, duration: float, **kwargs) -> None:
@@ -113,7 +131,7 @@ def log_security_event(event_type: str, user_id: str = None, **kwargs) -> None:
     security_data = {
         "event_type": event_type,
         "user_id": user_id,
-        "timestamp": structlog.processors.TimeStamper(fmt="iso"),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
     }
     security_data.update(kwargs)
     
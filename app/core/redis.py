@@ -0,0 +1,23 @@
+"""
+Redis connection pool shared across the process
+"""
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+# Single connection pool shared by all clients in this process so short
+# commands reuse authenticated connections instead of paying TCP+AUTH per call
+pool = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_POOL_SIZE,
+    decode_responses=True,
+    socket_timeout=5,
+    socket_keepalive=True,
+    health_check_interval=30,
+)
+
+
+def get_redis() -> redis.Redis:
+    """Get a Redis client bound to the shared connection pool"""
+    return redis.Redis(connection_pool=pool)
@@ -0,0 +1,35 @@
+"""
+Request-scoped cache for repeated lookups within one request
+"""
+
+from typing import Any, Hashable, Optional
+
+
+class RequestCache:
+    """Per-request memo for rows that cannot change mid-request.
+
+    Store an instance on ``request.state.cache`` and pass it to repository
+    read methods; repeated lookups (e.g. the current user resolved by the
+    auth dependency, permission checks and audit logging) then hit the dict
+    instead of the database. Holding the value keeps a strong reference, so
+    SQLAlchemy's weakref identity map cannot drop it mid-request.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self):
+        self._store: dict = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self._store.get(key)
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        self._store[key] = value
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        self._store.clear()
@@ -2,9 +2,10 @@
 ScrapingLog model for Dashboard Finance
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Enum, Index, case, text
 import enum
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -31,15 +32,15 @@ class ScrapingLog(Base):
     __tablename__ = "scraping_logs"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
-    # Scraping info
-    source = Column(String(100), nullable=False, index=True)  # yahoo, alpha_vantage, marketwatch
-    scraping_type = Column(Enum(ScrapingType), nullable=False, index=True)
+    # Scraping info (source is covered by the composite index below)
+    source = Column(String(100), nullable=False)  # yahoo, alpha_vantage, marketwatch
+    scraping_type = Column(Enum(ScrapingType, native_enum=False, length=20), nullable=False, index=True)
     target_symbol = Column(String(20), nullable=True, index=True)  # Stock symbol if applicable
     
     # Status and timing
-    status = Column(Enum(ScrapingStatus), default=ScrapingStatus.PENDING, nullable=False)
+    status = Column(Enum(ScrapingStatus, native_enum=False, length=20), default=ScrapingStatus.PENDING, nullable=False)
     started_at = Column(DateTime, nullable=False)
     completed_at = Column(DateTime, nullable=True)
     duration = Column(Float, nullable=True)  # Duration in seconds
@@ -60,9 +61,20 @@ class ScrapingLog(Base):
     request_headers = Column(Text, nullable=True)  # JSON string of headers
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Indexes for the retry sweep and monitoring dashboards; the partial index
+    # only covers failed rows, so it stays small as the table grows
+    __table_args__ = (
+        Index(
+            'idx_retryable_logs',
+            'started_at',
+            postgresql_where=text("status IN ('FAILED', 'TIMEOUT', 'RATE_LIMITED')"),
+        ),
+        Index('idx_source_type_status', 'source', 'scraping_type', 'status'),
+    )
+
     def __repr__(self):
         return f"<ScrapingLog(id={self.id}, source='{self.source}', type='{self.scraping_type}', status='{self.status}')>"
     
@@ -81,9 +93,15 @@ class ScrapingLog(Base):
         """Check if scraping can be retried"""
         return self.retry_count < self.max_retries and self.is_failed
     
-    @property
+    # Hybrid so dashboards can sort/filter on the rate in SQL without
+    # loading every row into Python first
+    @hybrid_property
     def efficiency_rate(self) -> float:
         """Calculate efficiency rate (records_processed / duration)"""
         if self.duration and self.duration > 0:
             return self.records_processed / self.duration
         return 0.0
+
+    @efficiency_rate.expression
+    def efficiency_rate(cls):
+        return case((cls.duration > 0, cls.records_processed / cls.duration), else_=0.0)
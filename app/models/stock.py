@@ -2,13 +2,23 @@
 Stock model for Dashboard Finance
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, Enum, CheckConstraint, DDL, Index, event, text
 from sqlalchemy.orm import relationship
 import enum
+from sqlalchemy.sql import func
 
 from .base import Base
 
+# The trigram indexes below need the pg_trgm extension; hook it into
+# every metadata create (create_tables, reset_alembic's schema rebuild,
+# test setups) so a fresh Postgres database doesn't fail with "operator
+# class gin_trgm_ops does not exist". No-op on other dialects.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
 class MarketType(enum.Enum):
     """Market type enumeration"""
     STOCK = "stock"
@@ -23,7 +33,7 @@ class Stock(Base):
     __tablename__ = "stocks"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Basic identification
     symbol = Column(String(20), unique=True, index=True, nullable=False)
@@ -32,7 +42,7 @@ class Stock(Base):
     
     # Market information
     market = Column(String(100), nullable=True)  # NYSE, NASDAQ, etc.
-    market_type = Column(Enum(MarketType), default=MarketType.STOCK, nullable=False)
+    market_type = Column(Enum(MarketType, native_enum=False, length=20), default=MarketType.STOCK, nullable=False)
     currency = Column(String(3), default="USD", nullable=False)
     
     # Company information
@@ -52,10 +62,46 @@ class Stock(Base):
     is_tradable = Column(Boolean, default=True, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
     last_price_update = Column(DateTime, nullable=True)
     
+    # Trigram GIN indexes let the search ILIKE '%query%' predicates use an
+    # index scan on Postgres (needs the pg_trgm extension) instead of a
+    # case-folding sequential scan; other dialects fall back to plain indexes
+    __table_args__ = (
+        # Guarantee symbol/isin are stored upper-cased, so get_by_symbol's
+        # symbol.upper() equality rides the plain unique indexes without a
+        # functional upper(...) index
+        CheckConstraint('symbol = upper(symbol)', name='ck_stock_symbol_upper'),
+        CheckConstraint('isin IS NULL OR isin = upper(isin)', name='ck_stock_isin_upper'),
+        # All three ILIKE arms of search_stocks' OR need an index for the
+        # planner to BitmapOr them; one unindexed arm forces a seq scan
+        Index(
+            'idx_stock_symbol_trgm', 'symbol',
+            postgresql_using='gin', postgresql_ops={'symbol': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_stock_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_stock_description_trgm', 'company_description',
+            postgresql_using='gin', postgresql_ops={'company_description': 'gin_trgm_ops'},
+        ),
+        # Compound indexes matching the list methods' filter + ORDER BY
+        # symbol, so pagination becomes a bounded index range scan
+        Index('idx_stock_active_symbol', 'is_active', 'symbol'),
+        Index('idx_stock_market_active_symbol', 'market', 'is_active', 'symbol'),
+        Index('idx_stock_sector_active_symbol', 'sector', 'is_active', 'symbol'),
+        # Small partial index driving get_stocks_needing_price_update's
+        # NULLS FIRST ordering over active stocks only
+        Index(
+            'idx_stock_stale_price', 'last_price_update',
+            postgresql_where=text('is_active'),
+        ),
+    )
+
     # Relationships
     prices = relationship("StockPrice", back_populates="stock", cascade="all, delete-orphan")
     portfolios = relationship("UserPortfolio", back_populates="stock", cascade="all, delete-orphan")
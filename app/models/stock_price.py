@@ -2,9 +2,10 @@
 StockPrice model for Dashboard Finance
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, Float, DateTime, String, ForeignKey, Index
+from sqlalchemy import Column, Integer, Float, DateTime, String, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -14,7 +15,7 @@ class StockPrice(Base):
     __tablename__ = "stock_prices"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Foreign keys
     stock_id = Column(Integer, ForeignKey("stocks.id"), nullable=False, index=True)
@@ -40,31 +41,52 @@ class StockPrice(Base):
     
     # Timestamps
     timestamp = Column(DateTime, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     stock = relationship("Stock", back_populates="prices")
     
-    # Indexes for performance
+    # Indexes for performance; the unique constraint keeps ingest idempotent
+    # and backs the ON CONFLICT upsert path
     __table_args__ = (
-        Index('idx_stock_timestamp', 'stock_id', 'timestamp'),
+        UniqueConstraint('stock_id', 'timestamp', name='uq_stock_timestamp'),
         Index('idx_timestamp_source', 'timestamp', 'source'),
+        # BRIN suits the append-only timestamp column: tiny index, fast
+        # range scans across all symbols (no-op outside Postgres)
+        Index('idx_stockprice_ts_brin', 'timestamp', postgresql_using='brin'),
+        # Backs "latest price per stock" lookups, e.g.
+        # SELECT DISTINCT ON (stock_id) ... ORDER BY stock_id, timestamp DESC
+        Index('idx_stock_ts_desc', 'stock_id', text('timestamp DESC')),
     )
     
     def __repr__(self):
         return f"<StockPrice(id={self.id}, stock_id={self.stock_id}, close={self.close_price}, timestamp='{self.timestamp}')>"
     
-    @property
+    # Hybrid so these also work as SQL expressions, e.g.
+    # select(StockPrice).where(StockPrice.is_up_day) filters in the database
+    @hybrid_property
     def price_range(self) -> float:
         """Get the price range (high - low)"""
         return self.high_price - self.low_price
-    
-    @property
+
+    @price_range.expression
+    def price_range(cls):
+        return cls.high_price - cls.low_price
+
+    @hybrid_property
     def is_up_day(self) -> bool:
         """Check if it's an up day (close > open)"""
         return self.close_price > self.open_price
-    
-    @property
+
+    @is_up_day.expression
+    def is_up_day(cls):
+        return cls.close_price > cls.open_price
+
+    @hybrid_property
     def is_down_day(self) -> bool:
         """Check if it's a down day (close < open)"""
         return self.close_price < self.open_price
+
+    @is_down_day.expression
+    def is_down_day(cls):
+        return cls.close_price < cls.open_price
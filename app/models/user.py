@@ -2,10 +2,10 @@
 User model for Dashboard Finance
 """
 
-from datetime import datetime
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum
 from sqlalchemy.orm import relationship
 import enum
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -21,7 +21,7 @@ class User(Base):
     __tablename__ = "users"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Authentication fields
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -31,15 +31,15 @@ class User(Base):
     # Profile fields
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
-    role = Column(Enum(UserRole), default=UserRole.USER, nullable=False)
+    role = Column(Enum(UserRole, native_enum=False, length=20), default=UserRole.USER, nullable=False)
     
     # Status fields
     is_active = Column(Boolean, default=True, nullable=False)
     is_verified = Column(Boolean, default=False, nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
     last_login = Column(DateTime, nullable=True)
     
     # Relationships
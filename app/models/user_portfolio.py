@@ -2,9 +2,9 @@
 UserPortfolio model for Dashboard Finance
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, Float, DateTime, String, ForeignKey, Text
+from sqlalchemy import Column, Integer, Float, DateTime, String, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -14,7 +14,7 @@ class UserPortfolio(Base):
     __tablename__ = "user_portfolios"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -29,13 +29,28 @@ class UserPortfolio(Base):
     notes = Column(Text, nullable=True)  # User notes about this position
     purchase_date = Column(DateTime, nullable=True)  # First purchase date
     
-    # Status
-    is_active = Column(String(20), default="active", nullable=False)  # active, sold, closed
+    # Status; boolean keeps the tuple narrow and makes the partial
+    # indexes/predicates integer comparisons instead of string ones
+    is_active = Column(Boolean, default=True, server_default=text("true"), nullable=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
     
+    # One open position per user and stock; closed rows stay out of the
+    # index, and it doubles as the ON CONFLICT target for add_position
+    __table_args__ = (
+        Index(
+            'uq_active_position', 'user_id', 'stock_id',
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        # Matches get_user_portfolio's filter + newest-first ordering so the
+        # planner walks the index instead of scanning and sorting
+        Index('idx_portfolio_user_active_created', 'user_id', 'is_active', text('created_at DESC')),
+    )
+
     # Relationships
     user = relationship("User", back_populates="portfolios")
     stock = relationship("Stock", back_populates="portfolios")
@@ -2,9 +2,9 @@
 Watchlist models for Dashboard Finance
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Numeric, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from .base import Base
 
@@ -14,7 +14,7 @@ class Watchlist(Base):
     __tablename__ = "watchlists"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -25,9 +25,21 @@ class Watchlist(Base):
     is_default = Column(Boolean, default=False, nullable=False)  # Is this the default watchlist?
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        # get_default_watchlist probes (user_id, is_default=true); the
+        # partial index covers only the handful of default rows
+        Index(
+            'idx_watchlist_user_default', 'user_id',
+            postgresql_where=text('is_default'),
+            sqlite_where=text('is_default'),
+        ),
+        # get_user_watchlists filters by user and orders by created_at DESC
+        Index('idx_watchlist_user_created', 'user_id', text('created_at DESC')),
+    )
+
     # Relationships
     user = relationship("User", back_populates="watchlists")
     items = relationship("WatchlistItem", back_populates="watchlist", cascade="all, delete-orphan")
@@ -41,7 +53,7 @@ class WatchlistItem(Base):
     __tablename__ = "watchlist_items"
     
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Foreign keys
     watchlist_id = Column(Integer, ForeignKey("watchlists.id"), nullable=False, index=True)
@@ -49,12 +61,18 @@ class WatchlistItem(Base):
     
     # Item info
     notes = Column(Text, nullable=True)  # User notes about this stock
-    target_price = Column(String(20), nullable=True)  # Target price for alerts
+    target_price = Column(Numeric(18, 6), nullable=True)  # Target price for alerts
     alert_enabled = Column(Boolean, default=True, nullable=False)  # Enable price alerts
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    # A stock appears once per watchlist; also the ON CONFLICT target for
+    # add_stock_to_watchlist's upsert
+    __table_args__ = (
+        UniqueConstraint('watchlist_id', 'stock_id', name='uq_watchlist_stock'),
+    )
+
     # Relationships
     watchlist = relationship("Watchlist", back_populates="items")
     stock = relationship("Stock", back_populates="watchlists")
@@ -3,15 +3,19 @@ Repository layer for data access
 """
 
 from .base import BaseRepository
+from .async_base import AsyncBaseRepository
 from .user_repository import UserRepository
 from .stock_repository import StockRepository
+from .stock_price_repository import StockPriceRepository
 from .portfolio_repository import PortfolioRepository
 from .watchlist_repository import WatchlistRepository
 
 __all__ = [
     "BaseRepository",
+    "AsyncBaseRepository",
     "UserRepository", 
     "StockRepository",
+    "StockPriceRepository",
     "PortfolioRepository",
     "WatchlistRepository"
 ]
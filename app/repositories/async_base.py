@@ -0,0 +1,192 @@
+"""
+Async base repository mirroring BaseRepository over AsyncSession
+"""
+
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, func, inspect, literal
+from pydantic import BaseModel
+import structlog
+
+from app.models.base import Base
+from app.repositories.base import _dump
+
+logger = structlog.get_logger()
+
+ModelType = TypeVar("ModelType", bound=Base)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+
+class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async variant of BaseRepository so scraper I/O can overlap DB I/O.
+
+    Sessions come from an AsyncSession factory bound to a
+    create_async_engine(...) engine; the method surface matches the sync
+    BaseRepository so call sites can migrate incrementally.
+    """
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+        self._cols = {c.key: c for c in model.__table__.columns}
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Get a single record by ID"""
+        try:
+            stmt = select(self.model).where(self.model.id == id)
+            result = await db.execute(stmt)
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error("Error getting record by ID", model=self.model.__name__, id=id, error=str(e))
+            raise
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ModelType]:
+        """Get multiple records with pagination and filters"""
+        try:
+            stmt = select(self.model)
+
+            if filters:
+                for field, value in filters.items():
+                    col = self._cols.get(field)
+                    if col is not None:
+                        stmt = stmt.where(col == value)
+
+            stmt = stmt.offset(skip).limit(limit)
+            result = await db.execute(stmt)
+            return result.scalars().all()
+        except Exception as e:
+            logger.error("Error getting multiple records", model=self.model.__name__, error=str(e))
+            raise
+
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelType:
+        """Create a new record"""
+        try:
+            db_obj = self.model(**_dump(obj_in))
+            db.add(db_obj)
+            # Flush to get the PK, then read it before commit: with
+            # expire_on_commit a post-commit attribute access would try an
+            # implicit refresh outside the greenlet context (MissingGreenlet)
+            await db.flush()
+            obj_id = db_obj.id
+            await db.commit()
+
+            logger.debug("Record created successfully", model=self.model.__name__, id=obj_id)
+            return db_obj
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error creating record", model=self.model.__name__, error=str(e))
+            raise
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        objs_in: List[CreateSchemaType],
+        chunk_size: int = 1000
+    ) -> int:
+        """Create many records with executemany INSERTs instead of per-row add/commit"""
+        try:
+            rows = [_dump(obj_in) for obj_in in objs_in]
+
+            for start in range(0, len(rows), chunk_size):
+                await db.execute(insert(self.model), rows[start:start + chunk_size])
+            await db.commit()
+
+            logger.info("Records bulk created", model=self.model.__name__, count=len(rows))
+            return len(rows)
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error bulk creating records", model=self.model.__name__, error=str(e))
+            raise
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | Dict[str, Any]
+    ) -> ModelType:
+        """Update an existing record"""
+        # Take the PK from the instance state, not the attribute: the
+        # instance may already be expired (e.g. by a prior commit), and an
+        # attribute access would refresh outside the greenlet context
+        obj_id = inspect(db_obj).identity[0]
+        try:
+            update_data = _dump(obj_in, exclude_unset=True)
+
+            for field, value in update_data.items():
+                if field in self._cols:
+                    setattr(db_obj, field, value)
+
+            # db_obj is already session-tracked; assignment marks it dirty
+            await db.commit()
+
+            logger.debug("Record updated successfully", model=self.model.__name__, id=obj_id)
+            return db_obj
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error updating record", model=self.model.__name__, id=obj_id, error=str(e))
+            raise
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        """Delete a record by ID"""
+        try:
+            obj = await db.get(self.model, id)
+            if obj:
+                await db.delete(obj)
+                await db.commit()
+                logger.debug("Record deleted successfully", model=self.model.__name__, id=id)
+                return obj
+            else:
+                logger.warning("Record not found for deletion", model=self.model.__name__, id=id)
+                return None
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error deleting record", model=self.model.__name__, id=id, error=str(e))
+            raise
+
+    async def bulk_remove(self, db: AsyncSession, ids: List[int]) -> int:
+        """Delete many records by ID with a single DELETE statement"""
+        try:
+            result = await db.execute(delete(self.model).where(self.model.id.in_(ids)))
+            await db.commit()
+
+            logger.info("Records bulk deleted", model=self.model.__name__, count=result.rowcount)
+            return result.rowcount
+        except Exception as e:
+            await db.rollback()
+            logger.error("Error bulk deleting records", model=self.model.__name__, error=str(e))
+            raise
+
+    async def exists(self, db: AsyncSession, id: Any) -> bool:
+        """Check if a record exists by ID"""
+        try:
+            stmt = select(literal(1)).where(self.model.id == id).limit(1)
+            result = await db.execute(stmt)
+            return result.first() is not None
+        except Exception as e:
+            logger.error("Error checking record existence", model=self.model.__name__, id=id, error=str(e))
+            raise
+
+    async def count(self, db: AsyncSession, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count total records with optional filters"""
+        try:
+            stmt = select(func.count()).select_from(self.model)
+
+            if filters:
+                for field, value in filters.items():
+                    col = self._cols.get(field)
+                    if col is not None:
+                        stmt = stmt.where(col == value)
+
+            result = await db.execute(stmt)
+            return result.scalar_one()
+        except Exception as e:
+            logger.error("Error counting records", model=self.model.__name__, error=str(e))
+            raise
@@ -2,9 +2,10 @@
 Base repository with common CRUD operations
 """
 
+import time
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert, func, inspect, literal, bindparam
 from pydantic import BaseModel
 import structlog
 
@@ -17,18 +18,31 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def _dump(obj: Any, exclude_unset: bool = False) -> Dict[str, Any]:
+    """Normalize a Pydantic model (v1 or v2) or plain dict to a dict."""
+    if isinstance(obj, dict):
+        return obj
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump(exclude_unset=exclude_unset)
+    return obj.dict(exclude_unset=exclude_unset)
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base repository with common CRUD operations"""
     
     def __init__(self, model: Type[ModelType]):
         self.model = model
+        # Column map precomputed once so filter loops use a dict lookup
+        # instead of a hasattr/getattr pair per field per call
+        self._cols = {c.key: c for c in model.__table__.columns}
+        # Hot single-row statements built once; execution only binds parameters
+        self._get_stmt = select(model).where(model.id == bindparam("id"))
+        self._exists_stmt = select(literal(1)).where(model.id == bindparam("id")).limit(1)
     
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         """Get a single record by ID"""
         try:
-            stmt = select(self.model).where(self.model.id == id)
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            return db.scalar(self._get_stmt, {"id": id})
         except Exception as e:
             logger.error("Error getting record by ID", model=self.model.__name__, id=id, error=str(e))
             raise
@@ -44,13 +58,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """Get multiple records with pagination and filters"""
         try:
             stmt = select(self.model)
-            
+
             # Apply filters if provided
             if filters:
                 for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        stmt = stmt.where(getattr(self.model, field) == value)
-            
+                    col = self._cols.get(field)
+                    if col is not None:
+                        stmt = stmt.where(col == value)
+
             stmt = stmt.offset(skip).limit(limit)
             result = db.execute(stmt)
             return result.scalars().all()
@@ -58,61 +73,163 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             logger.error("Error getting multiple records", model=self.model.__name__, error=str(e))
             raise
     
-    def create(self, db: Session, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record"""
+    def create(
+        self,
+        db: Session,
+        obj_in: CreateSchemaType,
+        *,
+        refresh: bool = False,
+        use_orm: bool = False
+    ) -> ModelType:
+        """Create a new record.
+
+        The default path is a Core INSERT ... RETURNING, which skips the
+        unit-of-work machinery and fetches server-computed values in the
+        same roundtrip. Pass use_orm=True for callers that rely on mapper
+        events; there, refresh=True adds the old post-commit SELECT.
+        """
         try:
-            # Convert Pydantic model to dict or use as-is if already a dict
-            if hasattr(obj_in, 'model_dump'):
-                obj_data = obj_in.model_dump()
-            elif hasattr(obj_in, 'dict'):
-                obj_data = obj_in.dict()
+            obj_data = _dump(obj_in)
+
+            # Read the id before commit: commit expires the instance, so a
+            # post-commit attribute access would re-SELECT the row and undo
+            # the round-trip this path saves
+            if use_orm:
+                db_obj = self.model(**obj_data)
+                db.add(db_obj)
+                db.flush()
+                obj_id = db_obj.id
+                db.commit()
+                if refresh:
+                    db.refresh(db_obj)
             else:
-                obj_data = obj_in
-            
-            # Create SQLAlchemy model instance
-            db_obj = self.model(**obj_data)
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
-            
-            logger.info("Record created successfully", model=self.model.__name__, id=db_obj.id)
+                stmt = insert(self.model).values(**obj_data).returning(self.model)
+                db_obj = db.scalars(stmt).one()
+                obj_id = db_obj.id
+                db.commit()
+
+            logger.debug("Record created successfully", model=self.model.__name__, id=obj_id)
             return db_obj
         except Exception as e:
             db.rollback()
             logger.error("Error creating record", model=self.model.__name__, error=str(e))
             raise
     
+    def bulk_create(
+        self,
+        db: Session,
+        objs_in: List[CreateSchemaType],
+        chunk_size: int = 1000
+    ) -> int:
+        """Create many records with executemany INSERTs instead of per-row add/commit.
+
+        chunk_size of 1000-10000 is the usual sweet spot; larger chunks trade
+        memory for fewer roundtrips.
+        """
+        try:
+            started = time.perf_counter()
+
+            # Convert each item to a plain dict once, outside the insert loop
+            rows = [_dump(obj_in) for obj_in in objs_in]
+
+            for start in range(0, len(rows), chunk_size):
+                db.execute(insert(self.model), rows[start:start + chunk_size])
+            db.commit()
+
+            # One log line per batch, not per row
+            logger.info(
+                "Records bulk created",
+                model=self.model.__name__,
+                count=len(rows),
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.error("Error bulk creating records", model=self.model.__name__, error=str(e))
+            raise
+
+    def bulk_upsert(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        conflict_cols: List[str],
+        update_cols: List[str],
+        chunk_size: int = 1000
+    ) -> int:
+        """Insert-or-update many rows in one statement per chunk.
+
+        Uses the dialect's native ON CONFLICT upsert so re-scraped rows don't
+        need a SELECT-then-INSERT-or-UPDATE roundtrip per row. The conflict
+        columns must be covered by a unique constraint or index.
+        """
+        try:
+            started = time.perf_counter()
+
+            dialect = db.get_bind().dialect.name
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                raise NotImplementedError(f"bulk_upsert not supported on dialect {dialect!r}")
+
+            for start in range(0, len(rows), chunk_size):
+                stmt = dialect_insert(self.model).values(rows[start:start + chunk_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=conflict_cols,
+                    set_={col: stmt.excluded[col] for col in update_cols},
+                )
+                db.execute(stmt)
+            db.commit()
+
+            logger.info(
+                "Records bulk upserted",
+                model=self.model.__name__,
+                count=len(rows),
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.error("Error bulk upserting records", model=self.model.__name__, error=str(e))
+            raise
+
     def update(
-        self, 
-        db: Session, 
-        *, 
-        db_obj: ModelType, 
-        obj_in: UpdateSchemaType | Dict[str, Any]
+        self,
+        db: Session,
+        *,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | Dict[str, Any],
+        refresh: bool = False
     ) -> ModelType:
-        """Update an existing record"""
+        """Update an existing record.
+
+        As with create, refresh is opt-in to avoid an extra SELECT per call.
+        """
+        # PK from the instance state rather than the attribute: reading
+        # db_obj.id after commit (or on an already-expired instance) would
+        # silently re-SELECT the row
+        obj_id = inspect(db_obj).identity[0]
         try:
-            # Convert Pydantic model to dict if needed
-            if hasattr(obj_in, 'model_dump'):
-                update_data = obj_in.model_dump(exclude_unset=True)
-            elif isinstance(obj_in, dict):
-                update_data = obj_in
-            else:
-                update_data = obj_in.dict(exclude_unset=True)
-            
-            # Update the object
+            update_data = _dump(obj_in, exclude_unset=True)
+
+            # Dict membership on the precomputed column map beats a
+            # hasattr call (and its exception slow path) per field
             for field, value in update_data.items():
-                if hasattr(db_obj, field):
+                if field in self._cols:
                     setattr(db_obj, field, value)
-            
-            db.add(db_obj)
+
+            # db_obj is already session-tracked; assignment marks it dirty
             db.commit()
-            db.refresh(db_obj)
-            
-            logger.info("Record updated successfully", model=self.model.__name__, id=db_obj.id)
+            if refresh:
+                db.refresh(db_obj)
+
+            logger.debug("Record updated successfully", model=self.model.__name__, id=obj_id)
             return db_obj
         except Exception as e:
             db.rollback()
-            logger.error("Error updating record", model=self.model.__name__, id=db_obj.id, error=str(e))
+            logger.error("Error updating record", model=self.model.__name__, id=obj_id, error=str(e))
             raise
     
     def remove(self, db: Session, *, id: int) -> ModelType:
@@ -122,7 +239,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if obj:
                 db.delete(obj)
                 db.commit()
-                logger.info("Record deleted successfully", model=self.model.__name__, id=id)
+                logger.debug("Record deleted successfully", model=self.model.__name__, id=id)
                 return obj
             else:
                 logger.warning("Record not found for deletion", model=self.model.__name__, id=id)
@@ -132,12 +249,51 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             logger.error("Error deleting record", model=self.model.__name__, id=id, error=str(e))
             raise
     
+    def bulk_remove(self, db: Session, ids: List[int]) -> int:
+        """Delete many records by ID with a single DELETE statement"""
+        try:
+            result = db.execute(delete(self.model).where(self.model.id.in_(ids)))
+            db.commit()
+
+            logger.info("Records bulk deleted", model=self.model.__name__, count=result.rowcount)
+            return result.rowcount
+        except Exception as e:
+            db.rollback()
+            logger.error("Error bulk deleting records", model=self.model.__name__, error=str(e))
+            raise
+
+    def claim_batch(
+        self,
+        db: Session,
+        *,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[ModelType]:
+        """Lock and return a batch of rows for exclusive processing.
+
+        Uses FOR UPDATE SKIP LOCKED so parallel workers draining the same
+        table (e.g. retryable scraping_logs) never contend on the same rows.
+        """
+        try:
+            stmt = select(self.model)
+
+            if filters:
+                for field, value in filters.items():
+                    col = self._cols.get(field)
+                    if col is not None:
+                        stmt = stmt.where(col == value)
+
+            stmt = stmt.limit(limit).with_for_update(skip_locked=True)
+            return db.execute(stmt).scalars().all()
+        except Exception as e:
+            logger.error("Error claiming batch", model=self.model.__name__, error=str(e))
+            raise
+
     def exists(self, db: Session, id: Any) -> bool:
         """Check if a record exists by ID"""
         try:
-            stmt = select(self.model.id).where(self.model.id == id)
-            result = db.execute(stmt)
-            return result.scalar_one_or_none() is not None
+            # SELECT 1 ... LIMIT 1 lets the planner stop at the first match
+            return db.execute(self._exists_stmt, {"id": id}).first() is not None
         except Exception as e:
             logger.error("Error checking record existence", model=self.model.__name__, id=id, error=str(e))
             raise
@@ -145,15 +301,15 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def count(self, db: Session, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count total records with optional filters"""
         try:
-            stmt = select(self.model)
-            
+            stmt = select(func.count()).select_from(self.model)
+
             if filters:
                 for field, value in filters.items():
-                    if hasattr(self.model, field):
-                        stmt = stmt.where(getattr(self.model, field) == value)
-            
-            result = db.execute(stmt)
-            return len(result.scalars().all())
+                    col = self._cols.get(field)
+                    if col is not None:
+                        stmt = stmt.where(col == value)
+
+            return db.execute(stmt).scalar_one()
         except Exception as e:
             logger.error("Error counting records", model=self.model.__name__, error=str(e))
             raise
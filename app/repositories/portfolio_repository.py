@@ -3,8 +3,8 @@ Portfolio repository for user portfolio management
 """
 
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy.orm import Session, selectinload, load_only
+from sqlalchemy import select, update, and_, func, desc, bindparam, text, tuple_
 import structlog
 
 from .base import BaseRepository
@@ -14,6 +14,15 @@ from app.models.stock import Stock
 
 logger = structlog.get_logger()
 
+# Prepared once at import so hot lookups skip statement construction
+_POSITION_STMT = select(UserPortfolio).where(
+    and_(
+        UserPortfolio.user_id == bindparam("user_id"),
+        UserPortfolio.stock_id == bindparam("stock_id"),
+        UserPortfolio.is_active.is_(True)
+    )
+)
+
 
 class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
     """Portfolio repository with portfolio-specific operations"""
@@ -21,16 +30,49 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
     def __init__(self):
         super().__init__(UserPortfolio)
     
-    def get_user_portfolio(self, db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[UserPortfolio]:
-        """Get all portfolio positions for a user"""
+    def get_user_portfolio(
+        self,
+        db: Session,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[tuple] = None
+    ) -> List[UserPortfolio]:
+        """Get all portfolio positions for a user.
+
+        Pass after=(created_at, id) of the last row seen to paginate by
+        keyset: the cost stays O(limit) at any page depth, unlike OFFSET,
+        which reads and discards every skipped row.
+        """
         try:
-            stmt = select(UserPortfolio).where(
+            # selectinload fetches all referenced stocks in one extra query
+            # instead of one SELECT per position (N+1); load_only projects
+            # just the columns the summary reads — notably skipping Stock's
+            # long company_description text. Unlisted columns are deferred
+            # and load on first access.
+            stmt = select(UserPortfolio).options(
+                load_only(
+                    UserPortfolio.quantity,
+                    UserPortfolio.average_price,
+                    UserPortfolio.total_invested,
+                    UserPortfolio.notes,
+                    UserPortfolio.created_at,
+                    UserPortfolio.stock_id,
+                ),
+                selectinload(UserPortfolio.stock).load_only(Stock.symbol, Stock.name),
+            ).where(
                 and_(
                     UserPortfolio.user_id == user_id,
-                    UserPortfolio.is_active == "active"
+                    UserPortfolio.is_active.is_(True)
                 )
-            ).order_by(UserPortfolio.created_at.desc()).offset(skip).limit(limit)
-            
+            ).order_by(UserPortfolio.created_at.desc(), UserPortfolio.id.desc())
+
+            if after is not None:
+                stmt = stmt.where(tuple_(UserPortfolio.created_at, UserPortfolio.id) < after)
+            elif skip:
+                stmt = stmt.offset(skip)
+            stmt = stmt.limit(limit)
+
             result = db.execute(stmt)
             return result.scalars().all()
         except Exception as e:
@@ -40,19 +82,40 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
     def get_position_by_stock(self, db: Session, user_id: int, stock_id: int) -> Optional[UserPortfolio]:
         """Get a specific position for a user and stock"""
         try:
-            stmt = select(UserPortfolio).where(
-                and_(
-                    UserPortfolio.user_id == user_id,
-                    UserPortfolio.stock_id == stock_id,
-                    UserPortfolio.is_active == "active"
-                )
-            )
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            return db.scalar(_POSITION_STMT, {"user_id": user_id, "stock_id": stock_id})
         except Exception as e:
             logger.error("Error getting position by stock", user_id=user_id, stock_id=stock_id, error=str(e))
             raise
     
+    def get_positions_by_stocks(
+        self,
+        db: Session,
+        user_id: int,
+        stock_ids: List[int]
+    ) -> Dict[int, UserPortfolio]:
+        """Fetch a user's open positions for many stocks in one query.
+
+        Reconciliation loops that called get_position_by_stock per stock
+        paid N roundtrips; one IN-list SELECT keyed by stock_id replaces
+        them all.
+        """
+        if not stock_ids:
+            return {}
+        try:
+            rows = db.execute(
+                select(UserPortfolio).where(
+                    and_(
+                        UserPortfolio.user_id == user_id,
+                        UserPortfolio.stock_id.in_(stock_ids),
+                        UserPortfolio.is_active.is_(True)
+                    )
+                )
+            ).scalars().all()
+            return {position.stock_id: position for position in rows}
+        except Exception as e:
+            logger.error("Error getting positions by stocks", user_id=user_id, error=str(e))
+            raise
+
     def add_position(
         self, 
         db: Session, 
@@ -62,49 +125,54 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
         price: float, 
         notes: Optional[str] = None
     ) -> UserPortfolio:
-        """Add a new position to user portfolio"""
+        """Add a new position to user portfolio.
+
+        A single INSERT ... ON CONFLICT DO UPDATE replaces the old
+        SELECT-then-INSERT-or-UPDATE pair, halving roundtrips and closing
+        the read-modify-write race; the running average recomputes in SQL.
+        The uq_active_position partial index is the conflict target.
+        """
         try:
-            # Check if position already exists
-            existing_position = self.get_position_by_stock(db, user_id, stock_id)
-            
-            if existing_position:
-                # Update existing position
-                new_total_quantity = existing_position.quantity + quantity
-                new_total_invested = existing_position.total_invested + (quantity * price)
-                new_avg_price = new_total_invested / new_total_quantity
-                
-                existing_position.quantity = new_total_quantity
-                existing_position.average_price = new_avg_price
-                existing_position.total_invested = new_total_invested
-                
-                if notes:
-                    existing_position.notes = notes
-                
-                db.add(existing_position)
-                db.commit()
-                db.refresh(existing_position)
-                
-                logger.info("Position updated", user_id=user_id, stock_id=stock_id, new_quantity=new_total_quantity)
-                return existing_position
+            dialect = db.get_bind().dialect.name
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
             else:
-                # Create new position
-                position_data = {
-                    "user_id": user_id,
-                    "stock_id": stock_id,
-                    "quantity": quantity,
-                    "average_price": price,
-                    "total_invested": quantity * price,
-                    "notes": notes,
-                    "is_active": "active"
-                }
-                
-                new_position = UserPortfolio(**position_data)
-                db.add(new_position)
-                db.commit()
-                db.refresh(new_position)
-                
-                logger.info("New position created", user_id=user_id, stock_id=stock_id, quantity=quantity)
-                return new_position
+                raise NotImplementedError(f"add_position not supported on dialect {dialect!r}")
+
+            stmt = dialect_insert(UserPortfolio).values(
+                user_id=user_id,
+                stock_id=stock_id,
+                quantity=quantity,
+                average_price=price,
+                total_invested=quantity * price,
+                notes=notes,
+                is_active=True,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "stock_id"],
+                index_where=text("is_active"),
+                set_={
+                    "quantity": UserPortfolio.quantity + stmt.excluded.quantity,
+                    "total_invested": UserPortfolio.total_invested + stmt.excluded.total_invested,
+                    "average_price": (
+                        (UserPortfolio.total_invested + stmt.excluded.total_invested)
+                        / (UserPortfolio.quantity + stmt.excluded.quantity)
+                    ),
+                    "notes": func.coalesce(stmt.excluded.notes, UserPortfolio.notes),
+                },
+            ).returning(UserPortfolio)
+
+            position = db.scalars(stmt).one()
+            # Read before commit: commit expires the instance, and a
+            # post-commit attribute access would re-SELECT the row the
+            # RETURNING clause just delivered
+            new_quantity = position.quantity
+            db.commit()
+
+            logger.info("Position upserted", user_id=user_id, stock_id=stock_id, quantity=new_quantity)
+            return position
         except Exception as e:
             db.rollback()
             logger.error("Error adding position", user_id=user_id, stock_id=stock_id, error=str(e))
@@ -119,26 +187,36 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
         price: Optional[float] = None,
         notes: Optional[str] = None
     ) -> Optional[UserPortfolio]:
-        """Update an existing position"""
+        """Update an existing position with a single targeted UPDATE"""
         try:
-            position = self.get_position_by_stock(db, user_id, stock_id)
-            if not position:
-                return None
-            
+            values = {}
             if quantity is not None:
-                position.quantity = quantity
+                values["quantity"] = quantity
                 if price is not None:
-                    position.average_price = price
-                position.total_invested = quantity * position.average_price
-            
+                    values["average_price"] = price
+                    values["total_invested"] = quantity * price
+                else:
+                    # Recompute invested from the stored average in SQL
+                    values["total_invested"] = UserPortfolio.average_price * quantity
             if notes is not None:
-                position.notes = notes
-            
-            db.add(position)
+                values["notes"] = notes
+
+            if not values:
+                return self.get_position_by_stock(db, user_id, stock_id)
+
+            stmt = update(UserPortfolio).where(
+                and_(
+                    UserPortfolio.user_id == user_id,
+                    UserPortfolio.stock_id == stock_id,
+                    UserPortfolio.is_active.is_(True)
+                )
+            ).values(**values).returning(UserPortfolio)
+
+            position = db.scalars(stmt).one_or_none()
             db.commit()
-            db.refresh(position)
-            
-            logger.info("Position updated", user_id=user_id, stock_id=stock_id)
+
+            if position is not None:
+                logger.info("Position updated", user_id=user_id, stock_id=stock_id)
             return position
         except Exception as e:
             db.rollback()
@@ -148,28 +226,49 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
     def close_position(self, db: Session, user_id: int, stock_id: int) -> bool:
         """Close a position (mark as closed)"""
         try:
-            position = self.get_position_by_stock(db, user_id, stock_id)
-            if not position:
-                return False
-            
-            position.is_active = "closed"
-            db.add(position)
+            # One-column status flip: a targeted UPDATE needs no fetch,
+            # no instance materialization and no refresh
+            result = db.execute(
+                update(UserPortfolio).where(
+                    and_(
+                        UserPortfolio.user_id == user_id,
+                        UserPortfolio.stock_id == stock_id,
+                        UserPortfolio.is_active.is_(True)
+                    )
+                ).values(is_active=False)
+            )
             db.commit()
-            
-            logger.info("Position closed", user_id=user_id, stock_id=stock_id)
-            return True
+
+            if result.rowcount:
+                logger.info("Position closed", user_id=user_id, stock_id=stock_id)
+            return result.rowcount > 0
         except Exception as e:
             db.rollback()
             logger.error("Error closing position", user_id=user_id, stock_id=stock_id, error=str(e))
             raise
     
+    def _get_totals(self, db: Session, user_id: int) -> tuple:
+        """Count and sum active positions for a user in one aggregate query"""
+        return db.execute(
+            select(
+                func.count(UserPortfolio.id),
+                func.coalesce(func.sum(UserPortfolio.total_invested), 0.0)
+            ).where(
+                and_(
+                    UserPortfolio.user_id == user_id,
+                    UserPortfolio.is_active.is_(True)
+                )
+            )
+        ).one()
+
     def get_portfolio_summary(self, db: Session, user_id: int) -> Dict[str, Any]:
         """Get portfolio summary for a user"""
         try:
-            # Get all active positions
-            positions = self.get_user_portfolio(db, user_id)
-            
-            if not positions:
+            # Totals aggregate server-side so we never transfer rows just to
+            # count/sum them in Python
+            total_positions, total_invested = self._get_totals(db, user_id)
+
+            if not total_positions:
                 return {
                     "total_positions": 0,
                     "total_invested": 0.0,
@@ -177,19 +276,19 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
                     "unrealized_pnl": 0.0,
                     "positions": []
                 }
-            
-            # Calculate totals
-            total_positions = len(positions)
-            total_invested = sum(pos.total_invested for pos in positions)
-            
+
+            # Detail rows stay paged; totals above cover the whole portfolio
+            positions = self.get_user_portfolio(db, user_id)
+
             # For now, estimated value is the same as invested (would need current prices)
             estimated_value = total_invested
             unrealized_pnl = estimated_value - total_invested
             
-            # Get position details with stock info
+            # Position details come from the eager-loaded relationship,
+            # so no per-row SELECT is issued here
             position_details = []
             for pos in positions:
-                stock = db.get(Stock, pos.stock_id)
+                stock = pos.stock
                 position_details.append({
                     "id": pos.id,
                     "stock_symbol": stock.symbol if stock else "Unknown",
@@ -225,7 +324,7 @@ class PortfolioRepository(BaseRepository[UserPortfolio, dict, dict]):
             ).where(
                 and_(
                     UserPortfolio.user_id == user_id,
-                    UserPortfolio.is_active == "active"
+                    UserPortfolio.is_active.is_(True)
                 )
             ).group_by(Stock.sector)
             
@@ -0,0 +1,57 @@
+"""
+Stock price repository for historical price data ingest
+"""
+
+import csv
+import io
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+import structlog
+
+from .base import BaseRepository
+from app.models.stock_price import StockPrice
+
+logger = structlog.get_logger()
+
+
+class StockPriceRepository(BaseRepository[StockPrice, dict, dict]):
+    """Stock price repository with bulk ingest fast paths"""
+
+    def __init__(self):
+        super().__init__(StockPrice)
+
+    def copy_load(self, db: Session, rows: List[Dict[str, Any]]) -> int:
+        """Load price rows via Postgres COPY FROM STDIN.
+
+        COPY is one to two orders of magnitude faster than executemany for
+        historical backfills; on other dialects this falls back to
+        bulk_create so callers stay portable.
+        """
+        if not rows:
+            return 0
+
+        if db.get_bind().dialect.name != "postgresql":
+            return self.bulk_create(db, rows)
+
+        try:
+            columns = [c for c in self._cols if c in rows[0]]
+
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            for row in rows:
+                writer.writerow(["" if row.get(c) is None else row.get(c) for c in columns])
+            buf.seek(0)
+
+            cursor = db.connection().connection.cursor()
+            cursor.copy_expert(
+                f"COPY stock_prices ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+                buf,
+            )
+            db.commit()
+
+            logger.info("Stock prices copy-loaded", count=len(rows))
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.error("Error copy-loading stock prices", error=str(e))
+            raise
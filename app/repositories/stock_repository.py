@@ -2,9 +2,9 @@
 Stock repository for stock management operations
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, or_, desc, asc
+from sqlalchemy import select, update, and_, or_, desc, asc, func, bindparam
 import structlog
 
 from .base import BaseRepository
@@ -12,6 +12,10 @@ from app.models.stock import Stock, MarketType
 
 logger = structlog.get_logger()
 
+# Prepared once at import so hot lookups skip statement construction
+_BY_SYMBOL_STMT = select(Stock).where(Stock.symbol == bindparam("symbol"))
+_BY_ISIN_STMT = select(Stock).where(Stock.isin == bindparam("isin"))
+
 
 class StockRepository(BaseRepository[Stock, dict, dict]):
     """Stock repository with stock-specific operations"""
@@ -22,9 +26,7 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
     def get_by_symbol(self, db: Session, symbol: str) -> Optional[Stock]:
         """Get stock by symbol"""
         try:
-            stmt = select(Stock).where(Stock.symbol == symbol.upper())
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            return db.scalar(_BY_SYMBOL_STMT, {"symbol": symbol.upper()})
         except Exception as e:
             logger.error("Error getting stock by symbol", symbol=symbol, error=str(e))
             raise
@@ -32,9 +34,7 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
     def get_by_isin(self, db: Session, isin: str) -> Optional[Stock]:
         """Get stock by ISIN"""
         try:
-            stmt = select(Stock).where(Stock.isin == isin.upper())
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            return db.scalar(_BY_ISIN_STMT, {"isin": isin.upper()})
         except Exception as e:
             logger.error("Error getting stock by ISIN", isin=isin, error=str(e))
             raise
@@ -75,16 +75,33 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
             logger.error("Error searching stocks", query=query, error=str(e))
             raise
     
-    def get_stocks_by_market(self, db: Session, market: str, skip: int = 0, limit: int = 100) -> List[Stock]:
-        """Get stocks by market (NYSE, NASDAQ, etc.)"""
+    def get_stocks_by_market(
+        self,
+        db: Session,
+        market: str,
+        skip: int = 0,
+        limit: int = 100,
+        after_symbol: Optional[str] = None
+    ) -> List[Stock]:
+        """Get stocks by market (NYSE, NASDAQ, etc.).
+
+        after_symbol enables keyset pagination: pass the last symbol of the
+        previous page and the query stays O(limit) at any depth.
+        """
         try:
             stmt = select(Stock).where(
                 and_(
                     Stock.market == market.upper(),
                     Stock.is_active == True
                 )
-            ).order_by(Stock.symbol).offset(skip).limit(limit)
-            
+            ).order_by(Stock.symbol)
+
+            if after_symbol is not None:
+                stmt = stmt.where(Stock.symbol > after_symbol.upper())
+            elif skip:
+                stmt = stmt.offset(skip)
+            stmt = stmt.limit(limit)
+
             result = db.execute(stmt)
             return result.scalars().all()
         except Exception as e:
@@ -123,28 +140,71 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
             logger.error("Error getting stocks by type", market_type=market_type.value, error=str(e))
             raise
     
-    def get_tradable_stocks(self, db: Session, skip: int = 0, limit: int = 100) -> List[Stock]:
-        """Get all tradable stocks"""
+    def get_tradable_stocks(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        after_symbol: Optional[str] = None
+    ) -> List[Stock]:
+        """Get all tradable stocks; after_symbol paginates by keyset"""
         try:
             stmt = select(Stock).where(
                 and_(
                     Stock.is_tradable == True,
                     Stock.is_active == True
                 )
-            ).order_by(Stock.symbol).offset(skip).limit(limit)
-            
+            ).order_by(Stock.symbol)
+
+            if after_symbol is not None:
+                stmt = stmt.where(Stock.symbol > after_symbol.upper())
+            elif skip:
+                stmt = stmt.offset(skip)
+            stmt = stmt.limit(limit)
+
             result = db.execute(stmt)
             return result.scalars().all()
         except Exception as e:
             logger.error("Error getting tradable stocks", error=str(e))
             raise
     
-    def get_stocks_needing_price_update(self, db: Session, hours_old: int = 24, limit: int = 100) -> List[Stock]:
-        """Get stocks that need price updates"""
+    def iter_tradable_stocks(self, db: Session, chunk_size: int = 500) -> Iterator[Stock]:
+        """Stream all tradable stocks without materializing the result set.
+
+        yield_per keeps at most chunk_size rows in memory, so batch exports
+        can walk the whole table while the existing .all() variant stays
+        for small-limit callers.
+        """
+        try:
+            stmt = select(Stock).where(
+                and_(
+                    Stock.is_tradable == True,
+                    Stock.is_active == True
+                )
+            ).order_by(Stock.symbol).execution_options(yield_per=chunk_size)
+
+            yield from db.execute(stmt).scalars()
+        except Exception as e:
+            logger.error("Error iterating tradable stocks", error=str(e))
+            raise
+
+    def get_stocks_needing_price_update(
+        self,
+        db: Session,
+        hours_old: int = 24,
+        limit: int = 100,
+        claim: bool = False
+    ) -> List[Stock]:
+        """Get stocks that need price updates.
+
+        With claim=True the batch is locked FOR UPDATE SKIP LOCKED, so
+        parallel refresh workers each grab a disjoint set of stocks; the
+        caller's commit after the batch releases the locks.
+        """
         try:
             from datetime import datetime, timedelta
             cutoff_time = datetime.utcnow() - timedelta(hours=hours_old)
-            
+
             stmt = select(Stock).where(
                 and_(
                     Stock.is_active == True,
@@ -154,7 +214,10 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
                     )
                 )
             ).order_by(Stock.last_price_update.asc().nullsfirst()).limit(limit)
-            
+
+            if claim:
+                stmt = stmt.with_for_update(skip_locked=True)
+
             result = db.execute(stmt)
             return result.scalars().all()
         except Exception as e:
@@ -164,57 +227,69 @@ class StockRepository(BaseRepository[Stock, dict, dict]):
     def update_stock_price_timestamp(self, db: Session, stock_id: int) -> bool:
         """Update the last_price_update timestamp for a stock"""
         try:
-            stock = db.get(Stock, stock_id)
-            if not stock:
-                return False
-            
             from datetime import datetime
-            stock.last_price_update = datetime.utcnow()
-            db.add(stock)
+            # Targeted UPDATE: no fetch, no instance churn, one roundtrip
+            result = db.execute(
+                update(Stock)
+                .where(Stock.id == stock_id)
+                .values(last_price_update=datetime.utcnow())
+            )
             db.commit()
-            
-            return True
+
+            return result.rowcount > 0
         except Exception as e:
             db.rollback()
             logger.error("Error updating stock price timestamp", stock_id=stock_id, error=str(e))
             raise
-    
+
+    def bulk_update_price_timestamps(self, db: Session, stock_ids: List[int]) -> int:
+        """Stamp last_price_update for many stocks with one UPDATE and one commit.
+
+        Refresh loops that called update_stock_price_timestamp per symbol paid
+        a roundtrip and an fsync per stock; this batches the whole refresh.
+        """
+        if not stock_ids:
+            return 0
+        try:
+            from datetime import datetime
+            result = db.execute(
+                update(Stock)
+                .where(Stock.id.in_(stock_ids))
+                .values(last_price_update=datetime.utcnow())
+            )
+            db.commit()
+
+            logger.info("Stock price timestamps updated", count=result.rowcount)
+            return result.rowcount
+        except Exception as e:
+            db.rollback()
+            logger.error("Error bulk updating price timestamps", error=str(e))
+            raise
+
     def get_market_summary(self, db: Session) -> Dict[str, Any]:
         """Get market summary statistics"""
         try:
-            # Count stocks by market type
-            type_counts = {}
-            for market_type in MarketType:
-                stmt = select(Stock).where(
-                    and_(
-                        Stock.market_type == market_type,
-                        Stock.is_active == True
-                    )
-                )
-                result = db.execute(stmt)
-                type_counts[market_type.value] = len(result.scalars().all())
-            
-            # Count stocks by market
-            market_counts = {}
-            markets_stmt = select(Stock.market).distinct().where(Stock.is_active == True)
-            markets_result = db.execute(markets_stmt)
-            markets = [row[0] for row in markets_result if row[0]]
-            
-            for market in markets:
-                stmt = select(Stock).where(
-                    and_(
-                        Stock.market == market,
-                        Stock.is_active == True
-                    )
-                )
-                result = db.execute(stmt)
-                market_counts[market] = len(result.scalars().all())
-            
-            # Total active stocks
-            total_stmt = select(Stock).where(Stock.is_active == True)
-            total_result = db.execute(total_stmt)
-            total_stocks = len(total_result.scalars().all())
-            
+            # Two GROUP BY queries replace one query per market type plus
+            # one per distinct market, each of which fetched full rows
+            # just to count them
+            type_rows = db.execute(
+                select(Stock.market_type, func.count())
+                .where(Stock.is_active == True)
+                .group_by(Stock.market_type)
+            ).all()
+            type_counts = {market_type.value: count for market_type, count in type_rows}
+
+            market_rows = db.execute(
+                select(Stock.market, func.count())
+                .where(Stock.is_active == True)
+                .group_by(Stock.market)
+            ).all()
+            market_counts = {market: count for market, count in market_rows if market}
+
+            total_stocks = db.execute(
+                select(func.count()).select_from(Stock).where(Stock.is_active == True)
+            ).scalar_one()
+
             return {
                 "total_stocks": total_stocks,
                 "by_type": type_counts,
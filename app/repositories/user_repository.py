@@ -2,19 +2,37 @@
 User repository for user management operations
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update, insert, bindparam
 from passlib.context import CryptContext
 import structlog
 
 from .base import BaseRepository
+from app.core.config import settings
+from app.core.request_cache import RequestCache
 from app.models.user import User, UserRole
 
 logger = structlog.get_logger()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; rounds come from settings so the hash cost can
+# be tuned to the hardware instead of passlib's conservative default
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    deprecated="auto",
+)
+
+# Prepared once at import so hot lookups skip statement construction
+_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+_BY_USERNAME_STMT = select(User).where(User.username == bindparam("username"))
+
+
+def _hash_password(password: str) -> str:
+    """Module-level so worker processes can import it for parallel hashing"""
+    return pwd_context.hash(password)
 
 
 class UserRepository(BaseRepository[User, dict, dict]):
@@ -23,22 +41,46 @@ class UserRepository(BaseRepository[User, dict, dict]):
     def __init__(self):
         super().__init__(User)
     
-    def get_by_email(self, db: Session, email: str) -> Optional[User]:
-        """Get user by email"""
+    def get_by_email(self, db: Session, email: str, cache: Optional[RequestCache] = None) -> Optional[User]:
+        """Get user by email, memoized per request when a cache is passed"""
         try:
-            stmt = select(User).where(User.email == email)
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            if cache is not None:
+                user = cache.get(("user_by_email", email))
+                if user is not None:
+                    return user
+
+            user = db.scalar(_BY_EMAIL_STMT, {"email": email})
+
+            if cache is not None and user is not None:
+                cache.set(("user_by_email", email), user)
+                cache.set(("user_by_id", user.id), user)
+            return user
         except Exception as e:
             logger.error("Error getting user by email", email=email, error=str(e))
             raise
+
+    def get_by_id(self, db: Session, user_id: int, cache: Optional[RequestCache] = None) -> Optional[User]:
+        """Get user by ID, memoized per request when a cache is passed"""
+        try:
+            if cache is not None:
+                user = cache.get(("user_by_id", user_id))
+                if user is not None:
+                    return user
+
+            user = self.get(db, user_id)
+
+            if cache is not None and user is not None:
+                cache.set(("user_by_id", user_id), user)
+                cache.set(("user_by_email", user.email), user)
+            return user
+        except Exception as e:
+            logger.error("Error getting user by ID", user_id=user_id, error=str(e))
+            raise
     
     def get_by_username(self, db: Session, username: str) -> Optional[User]:
         """Get user by username"""
         try:
-            stmt = select(User).where(User.username == username)
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
+            return db.scalar(_BY_USERNAME_STMT, {"username": username})
         except Exception as e:
             logger.error("Error getting user by username", username=username, error=str(e))
             raise
@@ -83,12 +125,51 @@ class UserRepository(BaseRepository[User, dict, dict]):
             logger.error("Error creating user", error=str(e))
             raise
     
-    def update_user(self, db: Session, user_id: int, update_data: dict) -> Optional[User]:
+    def bulk_create_users(self, db: Session, users: List[dict]) -> int:
+        """Import many users with parallel password hashing and one INSERT.
+
+        bcrypt dominates per-user cost, so hashes are computed across a
+        process pool (near-linear with cores); the rows then land in a
+        single executemany INSERT and one commit.
+        """
+        if not users:
+            return 0
+        try:
+            rows = [dict(u) for u in users]
+            to_hash = [(i, row.pop('password')) for i, row in enumerate(rows) if 'password' in row]
+
+            if to_hash:
+                with ProcessPoolExecutor() as executor:
+                    hashes = list(executor.map(_hash_password, [pw for _, pw in to_hash]))
+                for (i, _), password_hash in zip(to_hash, hashes):
+                    rows[i]['password_hash'] = password_hash
+
+            db.execute(insert(User), rows)
+            db.commit()
+
+            logger.info("Users bulk created", count=len(rows))
+            return len(rows)
+        except Exception as e:
+            db.rollback()
+            logger.error("Error bulk creating users", error=str(e))
+            raise
+
+    def update_user(
+        self,
+        db: Session,
+        user_id: int,
+        update_data: dict,
+        cache: Optional[RequestCache] = None
+    ) -> Optional[User]:
         """Update user with optional password hashing"""
         try:
             user = db.get(User, user_id)
             if not user:
                 return None
+
+            # A mutation makes any memoized copy stale
+            if cache is not None:
+                cache.invalidate(("user_by_id", user_id), ("user_by_email", user.email))
             
             # Hash password if provided
             if 'password' in update_data:
@@ -98,8 +179,8 @@ class UserRepository(BaseRepository[User, dict, dict]):
             for field, value in update_data.items():
                 if hasattr(user, field):
                     setattr(user, field, value)
-            
-            db.add(user)
+
+            # user is already session-tracked; assignment marks it dirty
             db.commit()
             db.refresh(user)
             
@@ -126,31 +207,36 @@ class UserRepository(BaseRepository[User, dict, dict]):
             
             if not user.is_active:
                 return None
-            
-            # Update last login
-            user.last_login = User.updated_at.default.arg()
-            db.add(user)
-            db.commit()
-            
+
+            # Stamp last_login at most once a minute so read-heavy auth
+            # traffic doesn't pay a commit per login; the targeted UPDATE
+            # skips the ORM flush and needs no refresh
+            now = datetime.utcnow()
+            if not user.last_login or now - user.last_login > timedelta(seconds=60):
+                db.execute(update(User).where(User.id == user.id).values(last_login=now))
+                db.commit()
+
             logger.info("User authenticated successfully", user_id=user.id, email=email)
             return user
         except Exception as e:
             logger.error("Error authenticating user", email=email, error=str(e))
             raise
     
-    def deactivate_user(self, db: Session, user_id: int) -> bool:
+    def deactivate_user(self, db: Session, user_id: int, cache: Optional[RequestCache] = None) -> bool:
         """Deactivate a user"""
         try:
-            user = db.get(User, user_id)
-            if not user:
-                return False
-            
-            user.is_active = False
-            db.add(user)
+            if cache is not None:
+                cache.invalidate(("user_by_id", user_id))
+
+            # Targeted UPDATE: no fetch, no instance churn, one roundtrip
+            result = db.execute(
+                update(User).where(User.id == user_id).values(is_active=False)
+            )
             db.commit()
-            
-            logger.info("User deactivated", user_id=user_id)
-            return True
+
+            if result.rowcount:
+                logger.info("User deactivated", user_id=user_id)
+            return result.rowcount > 0
         except Exception as e:
             db.rollback()
             logger.error("Error deactivating user", user_id=user_id, error=str(e))
@@ -159,16 +245,17 @@ class UserRepository(BaseRepository[User, dict, dict]):
     def change_user_role(self, db: Session, user_id: int, new_role: UserRole) -> Optional[User]:
         """Change user role"""
         try:
-            user = db.get(User, user_id)
-            if not user:
-                return None
-            
-            user.role = new_role
-            db.add(user)
+            stmt = update(User).where(User.id == user_id).values(role=new_role).returning(User)
+            user = db.scalars(stmt).one_or_none()
+            if user is not None:
+                # Detach before commit: expire_on_commit would discard the
+                # state the RETURNING row just loaded, so the caller's first
+                # attribute access would re-SELECT the row
+                db.expunge(user)
             db.commit()
-            db.refresh(user)
-            
-            logger.info("User role changed", user_id=user_id, new_role=new_role.value)
+
+            if user is not None:
+                logger.info("User role changed", user_id=user_id, new_role=new_role.value)
             return user
         except Exception as e:
             db.rollback()
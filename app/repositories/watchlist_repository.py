@@ -2,17 +2,35 @@
 Watchlist repository for user watchlist management
 """
 
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, or_
+from datetime import datetime
+from typing import Optional, List, Dict, Any, NamedTuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, update, and_, or_, case, func
 import structlog
 
 from .base import BaseRepository
+from app.core import cache
 from app.models.watchlist import Watchlist, WatchlistItem
 from app.models.stock import Stock
 
 logger = structlog.get_logger()
 
+# Cache TTL for watchlist reads; mutators invalidate eagerly, so the TTL
+# only bounds staleness across processes that miss an invalidation
+WATCHLIST_CACHE_TTL = 600
+
+
+class WatchlistItemView(NamedTuple):
+    """Flattened watchlist item row; far lighter than a dict per row in
+    the hot read loops, and field access bypasses hashing entirely"""
+    id: int
+    stock_symbol: str
+    stock_name: str
+    notes: Optional[str]
+    target_price: Optional[float]
+    alert_enabled: bool
+    created_at: Optional[str]
+
 
 class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
     """Watchlist repository with watchlist-specific operations"""
@@ -21,29 +39,59 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
         super().__init__(Watchlist)
     
     def get_user_watchlists(self, db: Session, user_id: int) -> List[Watchlist]:
-        """Get all watchlists for a user"""
-        try:
-            stmt = select(Watchlist).where(Watchlist.user_id == user_id).order_by(Watchlist.created_at.desc())
-            result = db.execute(stmt)
-            return result.scalars().all()
-        except Exception as e:
-            logger.error("Error getting user watchlists", user_id=user_id, error=str(e))
-            raise
+        """Get all watchlists for a user.
+
+        Redis-cached: watchlists change rarely relative to how often they
+        are read, so hits skip the database entirely. Mutators invalidate
+        the key; a Redis outage silently falls back to the query.
+
+        Read-only: database errors propagate to the app-level handler.
+        """
+        key = f"wl:user:{user_id}"
+        cached = cache.get_json(key)
+        if cached is not None:
+            return [self._watchlist_from_cache(row) for row in cached]
+
+        stmt = select(Watchlist).where(Watchlist.user_id == user_id).order_by(Watchlist.created_at.desc())
+        watchlists = db.execute(stmt).scalars().all()
+
+        cache.set_json(key, [
+            {
+                "id": wl.id,
+                "user_id": wl.user_id,
+                "name": wl.name,
+                "description": wl.description,
+                "is_default": wl.is_default,
+                "created_at": wl.created_at.isoformat() if wl.created_at else None,
+                "updated_at": wl.updated_at.isoformat() if wl.updated_at else None,
+            }
+            for wl in watchlists
+        ], ttl=WATCHLIST_CACHE_TTL)
+
+        return list(watchlists)
+
+    @staticmethod
+    def _watchlist_from_cache(row: Dict[str, Any]) -> Watchlist:
+        """Rebuild a detached Watchlist instance from its cached columns"""
+        return Watchlist(
+            id=row["id"],
+            user_id=row["user_id"],
+            name=row["name"],
+            description=row["description"],
+            is_default=row["is_default"],
+            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+            updated_at=datetime.fromisoformat(row["updated_at"]) if row["updated_at"] else None,
+        )
     
     def get_default_watchlist(self, db: Session, user_id: int) -> Optional[Watchlist]:
         """Get the default watchlist for a user"""
-        try:
-            stmt = select(Watchlist).where(
-                and_(
-                    Watchlist.user_id == user_id,
-                    Watchlist.is_default == True
-                )
+        stmt = select(Watchlist).where(
+            and_(
+                Watchlist.user_id == user_id,
+                Watchlist.is_default == True
             )
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
-        except Exception as e:
-            logger.error("Error getting default watchlist", user_id=user_id, error=str(e))
-            raise
+        )
+        return db.execute(stmt).scalar_one_or_none()
     
     def create_watchlist(
         self, 
@@ -70,6 +118,10 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
             db.add(new_watchlist)
             db.commit()
             db.refresh(new_watchlist)
+            # Invalidate only after a successful commit: doing it before
+            # lets a concurrent reader repopulate the key from pre-commit
+            # state and serve it stale for the whole TTL
+            cache.invalidate(f"wl:user:{user_id}")
             
             logger.info("Watchlist created", user_id=user_id, watchlist_id=new_watchlist.id, name=name)
             return new_watchlist
@@ -84,42 +136,46 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
         watchlist_id: int, 
         stock_id: int, 
         notes: Optional[str] = None,
-        target_price: Optional[str] = None
+        target_price: Optional[float] = None
     ) -> WatchlistItem:
-        """Add a stock to a watchlist"""
+        """Add a stock to a watchlist.
+
+        INSERT ... ON CONFLICT DO UPDATE folds the old select-then-insert-
+        or-update pair into one atomic statement; re-adding an existing
+        stock just refreshes its notes/target price. The uq_watchlist_stock
+        constraint is the conflict target.
+        """
         try:
-            # Check if stock is already in watchlist
-            existing_item = self._get_watchlist_item(db, watchlist_id, stock_id)
-            if existing_item:
-                # Update existing item
-                if notes is not None:
-                    existing_item.notes = notes
-                if target_price is not None:
-                    existing_item.target_price = target_price
-                
-                db.add(existing_item)
-                db.commit()
-                db.refresh(existing_item)
-                
-                logger.info("Watchlist item updated", watchlist_id=watchlist_id, stock_id=stock_id)
-                return existing_item
-            
-            # Create new item
-            item_data = {
-                "watchlist_id": watchlist_id,
-                "stock_id": stock_id,
-                "notes": notes,
-                "target_price": target_price,
-                "alert_enabled": True
-            }
-            
-            new_item = WatchlistItem(**item_data)
-            db.add(new_item)
+            dialect = db.get_bind().dialect.name
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            elif dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            else:
+                raise NotImplementedError(f"add_stock_to_watchlist not supported on dialect {dialect!r}")
+
+            stmt = dialect_insert(WatchlistItem).values(
+                watchlist_id=watchlist_id,
+                stock_id=stock_id,
+                notes=notes,
+                target_price=target_price,
+                alert_enabled=True,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["watchlist_id", "stock_id"],
+                set_={
+                    "notes": func.coalesce(stmt.excluded.notes, WatchlistItem.notes),
+                    "target_price": func.coalesce(stmt.excluded.target_price, WatchlistItem.target_price),
+                },
+            ).returning(WatchlistItem)
+
+            item = db.scalars(stmt).one()
             db.commit()
-            db.refresh(new_item)
-            
+            # Post-commit so a racing reader can't re-cache pre-commit state
+            cache.invalidate(f"wl:items:{watchlist_id}")
+
             logger.info("Stock added to watchlist", watchlist_id=watchlist_id, stock_id=stock_id)
-            return new_item
+            return item
         except Exception as e:
             db.rollback()
             logger.error("Error adding stock to watchlist", watchlist_id=watchlist_id, stock_id=stock_id, error=str(e))
@@ -134,6 +190,8 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
             
             db.delete(item)
             db.commit()
+            # Post-commit so a racing reader can't re-cache pre-commit state
+            cache.invalidate(f"wl:items:{watchlist_id}")
             
             logger.info("Stock removed from watchlist", watchlist_id=watchlist_id, stock_id=stock_id)
             return True
@@ -142,27 +200,40 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
             logger.error("Error removing stock from watchlist", watchlist_id=watchlist_id, stock_id=stock_id, error=str(e))
             raise
     
-    def get_watchlist_items(self, db: Session, watchlist_id: int) -> List[Dict[str, Any]]:
-        """Get all items in a watchlist with stock details"""
+    def get_watchlist_items(self, db: Session, watchlist_id: int) -> List[WatchlistItemView]:
+        """Get all items in a watchlist with stock details (Redis-cached)"""
         try:
-            stmt = select(WatchlistItem).where(WatchlistItem.watchlist_id == watchlist_id)
-            result = db.execute(stmt)
-            items = result.scalars().all()
-            
-            # Get stock details for each item
+            key = f"wl:items:{watchlist_id}"
+            cached = cache.get_json(key)
+            if cached is not None:
+                return [WatchlistItemView._make(row) for row in cached]
+
+            # joinedload pulls the stock rows in the same SELECT instead of
+            # one db.get(Stock, ...) per item (N+1); stream_results +
+            # yield_per keeps memory flat on huge watchlists by hydrating
+            # entities in chunks off a server-side cursor instead of
+            # materializing the whole result set up front
+            stmt = select(WatchlistItem).options(
+                joinedload(WatchlistItem.stock)
+            ).where(
+                WatchlistItem.watchlist_id == watchlist_id
+            ).execution_options(stream_results=True, yield_per=1000)
+
             item_details = []
-            for item in items:
-                stock = db.get(Stock, item.stock_id)
-                item_details.append({
-                    "id": item.id,
-                    "stock_symbol": stock.symbol if stock else "Unknown",
-                    "stock_name": stock.name if stock else "Unknown",
-                    "notes": item.notes,
-                    "target_price": item.target_price,
-                    "alert_enabled": item.alert_enabled,
-                    "created_at": item.created_at.isoformat() if item.created_at else None
-                })
-            
+            for item in db.execute(stmt).scalars():
+                stock = item.stock
+                item_details.append(WatchlistItemView(
+                    id=item.id,
+                    stock_symbol=stock.symbol if stock else "Unknown",
+                    stock_name=stock.name if stock else "Unknown",
+                    notes=item.notes,
+                    target_price=float(item.target_price) if item.target_price is not None else None,
+                    alert_enabled=item.alert_enabled,
+                    created_at=item.created_at.isoformat() if item.created_at else None,
+                ))
+
+            # NamedTuples serialize as JSON arrays; _make restores them on hit
+            cache.set_json(key, [list(view) for view in item_details], ttl=WATCHLIST_CACHE_TTL)
             return item_details
         except Exception as e:
             logger.error("Error getting watchlist items", watchlist_id=watchlist_id, error=str(e))
@@ -173,32 +244,46 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
         db: Session, 
         watchlist_id: int, 
         query: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[WatchlistItemView]:
         """Search stocks in a watchlist by symbol or name"""
         try:
-            # Get watchlist items
-            stmt = select(WatchlistItem).where(WatchlistItem.watchlist_id == watchlist_id)
-            result = db.execute(stmt)
-            items = result.scalars().all()
-            
-            # Get stock details and filter by query
-            matching_items = []
-            for item in items:
-                stock = db.get(Stock, item.stock_id)
-                if stock and (
-                    query.lower() in stock.symbol.lower() or 
-                    query.lower() in stock.name.lower()
-                ):
-                    matching_items.append({
-                        "id": item.id,
-                        "stock_symbol": stock.symbol,
-                        "stock_name": stock.name,
-                        "notes": item.notes,
-                        "target_price": item.target_price,
-                        "alert_enabled": item.alert_enabled
-                    })
-            
-            return matching_items
+            # Filter in SQL with ILIKE on the joined stock instead of
+            # loading every item and matching substrings in Python, and
+            # project only the returned columns — no entity hydration, no
+            # unused Stock columns over the wire
+            pattern = f"%{query}%"
+            stmt = select(
+                WatchlistItem.id,
+                Stock.symbol,
+                Stock.name,
+                WatchlistItem.notes,
+                WatchlistItem.target_price,
+                WatchlistItem.alert_enabled,
+                WatchlistItem.created_at,
+            ).join(
+                WatchlistItem.stock
+            ).where(
+                and_(
+                    WatchlistItem.watchlist_id == watchlist_id,
+                    or_(
+                        Stock.symbol.ilike(pattern),
+                        Stock.name.ilike(pattern)
+                    )
+                )
+            )
+
+            return [
+                WatchlistItemView(
+                    id=row.id,
+                    stock_symbol=row.symbol,
+                    stock_name=row.name,
+                    notes=row.notes,
+                    target_price=float(row.target_price) if row.target_price is not None else None,
+                    alert_enabled=row.alert_enabled,
+                    created_at=row.created_at.isoformat() if row.created_at else None,
+                )
+                for row in db.execute(stmt)
+            ]
         except Exception as e:
             logger.error("Error searching watchlist stocks", watchlist_id=watchlist_id, query=query, error=str(e))
             raise
@@ -206,18 +291,29 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
     def set_default_watchlist(self, db: Session, user_id: int, watchlist_id: int) -> bool:
         """Set a watchlist as the default for a user"""
         try:
-            # Unset other defaults
-            self._unset_other_defaults(db, user_id)
-            
-            # Set new default
-            watchlist = db.get(Watchlist, watchlist_id)
-            if not watchlist or watchlist.user_id != user_id:
+            # Cheap ownership guard, then one UPDATE ... CASE flips the flag
+            # across all of the user's watchlists atomically — no separate
+            # unset pass, no row loads, one commit
+            owns = db.execute(
+                select(Watchlist.id).where(
+                    and_(
+                        Watchlist.id == watchlist_id,
+                        Watchlist.user_id == user_id
+                    )
+                ).limit(1)
+            ).first()
+            if owns is None:
                 return False
-            
-            watchlist.is_default = True
-            db.add(watchlist)
+
+            db.execute(
+                update(Watchlist)
+                .where(Watchlist.user_id == user_id)
+                .values(is_default=case((Watchlist.id == watchlist_id, True), else_=False))
+            )
             db.commit()
-            
+            # Post-commit so a racing reader can't re-cache pre-commit state
+            cache.invalidate(f"wl:user:{user_id}")
+
             logger.info("Default watchlist set", user_id=user_id, watchlist_id=watchlist_id)
             return True
         except Exception as e:
@@ -228,35 +324,26 @@ class WatchlistRepository(BaseRepository[Watchlist, dict, dict]):
     def _unset_other_defaults(self, db: Session, user_id: int) -> None:
         """Unset other default watchlists for a user"""
         try:
-            stmt = select(Watchlist).where(
-                and_(
-                    Watchlist.user_id == user_id,
-                    Watchlist.is_default == True
-                )
+            # One set-oriented UPDATE replaces the row-load plus per-row
+            # flush; the caller's commit makes it durable
+            db.execute(
+                update(Watchlist).where(
+                    and_(
+                        Watchlist.user_id == user_id,
+                        Watchlist.is_default == True
+                    )
+                ).values(is_default=False)
             )
-            result = db.execute(stmt)
-            defaults = result.scalars().all()
-            
-            for default in defaults:
-                default.is_default = False
-                db.add(default)
-            
-            db.commit()
         except Exception as e:
             logger.error("Error unsetting other defaults", user_id=user_id, error=str(e))
             raise
     
     def _get_watchlist_item(self, db: Session, watchlist_id: int, stock_id: int) -> Optional[WatchlistItem]:
         """Get a specific watchlist item"""
-        try:
-            stmt = select(WatchlistItem).where(
-                and_(
-                    WatchlistItem.watchlist_id == watchlist_id,
-                    WatchlistItem.stock_id == stock_id
-                )
+        stmt = select(WatchlistItem).where(
+            and_(
+                WatchlistItem.watchlist_id == watchlist_id,
+                WatchlistItem.stock_id == stock_id
             )
-            result = db.execute(stmt)
-            return result.scalar_one_or_none()
-        except Exception as e:
-            logger.error("Error getting watchlist item", watchlist_id=watchlist_id, stock_id=stock_id, error=str(e))
-            raise
+        )
+        return db.execute(stmt).scalar_one_or_none()
@@ -3,6 +3,7 @@ Main seeder for populating database with test data
 """
 
 from datetime import datetime
+from sqlalchemy import insert, delete, text
 from sqlalchemy.orm import Session
 import structlog
 
@@ -11,7 +12,7 @@ from app.models.stock import Stock, MarketType
 from app.models.stock_price import StockPrice
 from app.models.user_portfolio import UserPortfolio
 from app.models.watchlist import Watchlist, WatchlistItem
-from app.repositories.user_repository import UserRepository
+from app.repositories.user_repository import UserRepository, _hash_password
 from app.repositories.stock_repository import StockRepository
 from app.repositories.portfolio_repository import PortfolioRepository
 from app.repositories.watchlist_repository import WatchlistRepository
@@ -98,13 +99,21 @@ class MainSeeder:
             }
         ]
         
-        users = []
+        # One executemany INSERT ... RETURNING replaces a round-trip and
+        # commit per user; downstream seed steps still get ORM instances.
+        # bcrypt is the expensive part, so hash each distinct password once
+        # and reuse it (most seed users share "password123")
+        hashes = {pw: _hash_password(pw) for pw in {u["password"] for u in users_data}}
         for user_data in users_data:
-            user = self.user_repo.create_user(self.db, user_data)
-            users.append(user)
-            logger.info(f"Created user: {user.username}")
-        
-        return users
+            user_data["password_hash"] = hashes[user_data.pop("password")]
+
+        users = self.db.scalars(
+            insert(User).returning(User), users_data
+        ).all()
+        self.db.commit()
+
+        logger.info("Users seeded", count=len(users))
+        return list(users)
     
     def _seed_stocks(self) -> list:
         """Seed stocks with test data"""
@@ -222,85 +231,91 @@ class MainSeeder:
             }
         ]
         
-        stocks = []
-        for stock_data in stocks_data:
-            stock = self.stock_repo.create(self.db, stock_data)
-            stocks.append(stock)
-            logger.info(f"Created stock: {stock.symbol} - {stock.name}")
-        
-        return stocks
+        stocks = self.db.scalars(
+            insert(Stock).returning(Stock), stocks_data
+        ).all()
+        self.db.commit()
+
+        logger.info("Stocks seeded", count=len(stocks))
+        return list(stocks)
     
     def _seed_stock_prices(self, stocks: list) -> None:
         """Seed stock prices with historical data"""
         logger.info("Seeding stock prices...")
         
         from datetime import datetime, timedelta
-        
+
+        import numpy as np
+
         # Generate 30 days of historical data
+        n_days = 31
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=30)
-        
+        dates = [start_date + timedelta(days=i) for i in range(n_days)]
+        base_price = 100.0  # Base price for simulation
+        rng = np.random.default_rng()
+
+        # Simulate each stock's whole OHLCV series as NumPy arrays in one
+        # shot instead of four scalar random calls per day, then feed plain
+        # dicts to bulk_insert_mappings
+        price_rows = []
         for stock in stocks:
             if stock.market_type == MarketType.INDEX:
                 continue  # Skip indices for now
-            
-            current_date = start_date
-            base_price = 100.0  # Base price for simulation
-            
-            while current_date <= end_date:
-                # Simulate daily price movement
-                import random
-                change_percent = random.uniform(-0.05, 0.05)  # -5% to +5%
-                new_price = base_price * (1 + change_percent)
-                
-                # Generate OHLC data
-                open_price = base_price
-                high_price = max(open_price, new_price) * random.uniform(1.0, 1.02)
-                low_price = min(open_price, new_price) * random.uniform(0.98, 1.0)
-                close_price = new_price
-                
-                # Volume
-                volume = random.randint(1000000, 10000000)
-                
-                price_data = {
+
+            # Daily moves of -5% to +5%, compounded into the close series
+            pct = rng.uniform(-0.05, 0.05, size=n_days)
+            close = base_price * np.cumprod(1 + pct)
+            open_ = np.concatenate(([base_price], close[:-1]))
+            high = np.round(np.maximum(open_, close) * rng.uniform(1.0, 1.02, n_days), 2)
+            low = np.round(np.minimum(open_, close) * rng.uniform(0.98, 1.0, n_days), 2)
+            volume = rng.integers(1000000, 10000001, n_days)
+            change = np.round(close - open_, 2)
+            change_pct = np.round((close - open_) / open_ * 100, 2)
+            open_ = np.round(open_, 2)
+            close = np.round(close, 2)
+
+            for i in range(n_days):
+                price_rows.append({
                     "stock_id": stock.id,
-                    "open_price": round(open_price, 2),
-                    "high_price": round(high_price, 2),
-                    "low_price": round(low_price, 2),
-                    "close_price": round(close_price, 2),
-                    "adjusted_close": round(close_price, 2),
-                    "volume": volume,
-                    "average_volume": volume,
-                    "change_amount": round(close_price - open_price, 2),
-                    "change_percent": round(((close_price - open_price) / open_price) * 100, 2),
+                    "open_price": float(open_[i]),
+                    "high_price": float(high[i]),
+                    "low_price": float(low[i]),
+                    "close_price": float(close[i]),
+                    "adjusted_close": float(close[i]),
+                    "volume": int(volume[i]),
+                    "average_volume": int(volume[i]),
+                    "change_amount": float(change[i]),
+                    "change_percent": float(change_pct[i]),
                     "source": "seeder",
                     "data_quality": "high",
-                    "timestamp": current_date
-                }
-                
-                price = StockPrice(**price_data)
-                self.db.add(price)
-                
-                # Update base price for next day
-                base_price = close_price
-                current_date += timedelta(days=1)
-            
-            # Update stock's last price update
+                    "timestamp": dates[i]
+                })
+
+            # Update stock's last price update; the instance is already
+            # session-tracked, so assignment alone marks it dirty
             stock.last_price_update = end_date
-            self.db.add(stock)
-        
+
+        # Chunked executemany keeps statement size bounded if the seeded
+        # window ever grows from a month to years of history
+        for start in range(0, len(price_rows), 1000):
+            self.db.bulk_insert_mappings(StockPrice, price_rows[start:start + 1000])
         self.db.commit()
-        logger.info("Stock prices seeded successfully")
+        logger.info("Stock prices seeded successfully", count=len(price_rows))
     
     def _seed_portfolios(self, users: list, stocks: list) -> None:
         """Seed user portfolios with test positions"""
         logger.info("Seeding portfolios...")
-        
+
+        # O(1) dict lookups rather than a linear scan per reference
+        users_by_name = {u.username: u for u in users}
+        stocks_by_symbol = {s.symbol: s for s in stocks}
+
         # Give John Doe some positions
-        john = next(u for u in users if u.username == "john_doe")
-        
+        john = users_by_name["john_doe"]
+
         # Add AAPL position
-        aapl = next(s for s in stocks if s.symbol == "AAPL")
+        aapl = stocks_by_symbol["AAPL"]
         self.portfolio_repo.add_position(
             self.db, 
             john.id, 
@@ -311,7 +326,7 @@ class MainSeeder:
         )
         
         # Add MSFT position
-        msft = next(s for s in stocks if s.symbol == "MSFT")
+        msft = stocks_by_symbol["MSFT"]
         self.portfolio_repo.add_position(
             self.db, 
             john.id, 
@@ -322,10 +337,10 @@ class MainSeeder:
         )
         
         # Give Jane Smith some positions
-        jane = next(u for u in users if u.username == "jane_smith")
-        
+        jane = users_by_name["jane_smith"]
+
         # Add SPY position
-        spy = next(s for s in stocks if s.symbol == "SPY")
+        spy = stocks_by_symbol["SPY"]
         self.portfolio_repo.add_position(
             self.db, 
             jane.id, 
@@ -340,9 +355,12 @@ class MainSeeder:
     def _seed_watchlists(self, users: list, stocks: list) -> None:
         """Seed user watchlists with test data"""
         logger.info("Seeding watchlists...")
-        
+
+        users_by_name = {u.username: u for u in users}
+        stocks_by_symbol = {s.symbol: s for s in stocks}
+
         # Create watchlist for John Doe
-        john = next(u for u in users if u.username == "john_doe")
+        john = users_by_name["john_doe"]
         tech_watchlist = self.watchlist_repo.create_watchlist(
             self.db, 
             john.id, 
@@ -352,17 +370,17 @@ class MainSeeder:
         )
         
         # Add stocks to watchlist
-        googl = next(s for s in stocks if s.symbol == "GOOGL")
+        googl = stocks_by_symbol["GOOGL"]
         self.watchlist_repo.add_stock_to_watchlist(
             self.db, 
             tech_watchlist.id, 
             googl.id, 
             notes="Monitor for entry point",
-            target_price="120.00"
+            target_price=120.00
         )
         
         # Create watchlist for Jane Smith
-        jane = next(u for u in users if u.username == "jane_smith")
+        jane = users_by_name["jane_smith"]
         etf_watchlist = self.watchlist_repo.create_watchlist(
             self.db, 
             jane.id, 
@@ -372,13 +390,13 @@ class MainSeeder:
         )
         
         # Add QQQ to watchlist
-        qqq = next(s for s in stocks if s.symbol == "QQQ")
+        qqq = stocks_by_symbol["QQQ"]
         self.watchlist_repo.add_stock_to_watchlist(
             self.db, 
             etf_watchlist.id, 
             qqq.id, 
             notes="Tech-heavy ETF for growth",
-            target_price="350.00"
+            target_price=350.00
         )
         
         logger.info("Watchlists seeded successfully")
@@ -386,19 +404,25 @@ class MainSeeder:
     def clear_all_data(self) -> None:
         """Clear all seeded data (use with caution!)"""
         logger.warning("Clearing all seeded data...")
-        
+
         try:
-            # Clear in reverse order due to foreign key constraints
-            self.db.query(WatchlistItem).delete()
-            self.db.query(Watchlist).delete()
-            self.db.query(UserPortfolio).delete()
-            self.db.query(StockPrice).delete()
-            self.db.query(Stock).delete()
-            self.db.query(User).delete()
-            
+            if self.db.get_bind().dialect.name == "postgresql":
+                # One TRUNCATE wipes every table, resets the id sequences
+                # and cascades through the foreign keys — far cheaper than
+                # row-by-row DELETEs on large seed runs
+                self.db.execute(text(
+                    "TRUNCATE TABLE watchlist_items, watchlists, user_portfolios, "
+                    "stock_prices, stocks, users RESTART IDENTITY CASCADE"
+                ))
+            else:
+                # SQLite has no TRUNCATE; bulk DELETEs in reverse foreign
+                # key order within the one transaction
+                for model in (WatchlistItem, Watchlist, UserPortfolio, StockPrice, Stock, User):
+                    self.db.execute(delete(model))
+
             self.db.commit()
             logger.info("All data cleared successfully")
-            
+
         except Exception as e:
             self.db.rollback()
             logger.error("Error clearing data", error=str(e))
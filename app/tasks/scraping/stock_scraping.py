@@ -2,32 +2,172 @@
 Stock scraping tasks for Celery.
 """
 
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import structlog
 from celery import shared_task
-from typing import Dict, Any
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import get_db_context
+from app.models.stock import Stock
+
+logger = structlog.get_logger()
+
+# Symbols per batch task; one batch costs one TCP/TLS handshake
+_BATCH_SIZE = 50
+
+# Yahoo Finance chart endpoint; one GET per symbol, all multiplexed over
+# the same pooled session
+_QUOTE_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+# Per-thread event loop and HTTP client, created lazily on the first
+# task and reused for the life of the worker so later batches ride
+# existing keep-alive connections instead of re-handshaking TCP/TLS.
+# Thread-local (rather than module-global) so the scraping queue can run
+# under `--pool=threads` with many concurrent tasks per process; under
+# prefork each child has a single thread and this degrades to one
+# loop/client per process. celery_app's worker_process_shutdown signal
+# closes them.
+_local = threading.local()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop
+
+
+def _get_client() -> httpx.AsyncClient:
+    client = getattr(_local, "client", None)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50),
+            timeout=httpx.Timeout(settings.SCRAPING_TIMEOUT_SECONDS),
+            headers={"User-Agent": settings.SCRAPING_USER_AGENT},
+        )
+        _local.client = client
+    return client
+
+
+def close_http_client() -> None:
+    """Close this thread's shared client and loop (worker_process_shutdown)"""
+    client = getattr(_local, "client", None)
+    if client is not None and not client.is_closed:
+        _get_loop().run_until_complete(client.aclose())
+    _local.client = None
+    loop = getattr(_local, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.close()
+    _local.loop = None
+
+
+async def _fetch_symbols(client: httpx.AsyncClient, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch quote data for all symbols concurrently on the shared client"""
+    responses = await asyncio.gather(
+        *(client.get(_QUOTE_URL.format(symbol=symbol)) for symbol in symbols),
+        return_exceptions=True,
+    )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for symbol, response in zip(symbols, responses):
+        if isinstance(response, Exception):
+            results[symbol] = {"status": "error", "error": str(response)}
+        elif response.status_code != 200:
+            results[symbol] = {"status": "error", "error": f"HTTP {response.status_code}"}
+        else:
+            results[symbol] = {"status": "success", "data": response.json()}
+    return results
+
+
+@shared_task(bind=True, name="scraping.scrape_stock_data_batch")
+def scrape_stock_data_batch(self, symbols: List[str]) -> Dict[str, Any]:
+    """
+    Scrape stock data for a batch of symbols.
+
+    One task fetches N symbols concurrently over a shared HTTP/2
+    connection pool, so a batch costs one TCP/TLS handshake instead of
+    one per symbol. Schedule batches with a Celery group/chord rather
+    than spawning a task per symbol.
+
+    Args:
+        symbols: Stock symbols to scrape
+
+    Returns:
+        Dict mapping each symbol to its scrape result
+    """
+    if not symbols:
+        return {"status": "success", "results": {}}
+
+    try:
+        results = _get_loop().run_until_complete(_fetch_symbols(_get_client(), symbols))
+        errors = sum(1 for r in results.values() if r["status"] == "error")
+        logger.info("Stock batch scraped", symbols=len(symbols), errors=errors)
+        return {"status": "success", "results": results}
+    except Exception as e:
+        logger.error("Error scraping stock batch", symbols=len(symbols), error=str(e))
+        raise
 
 @shared_task(bind=True, name="scraping.scrape_stock_data")
 def scrape_stock_data(self, symbol: str) -> Dict[str, Any]:
     """
-    Scrape stock data for a given symbol.
-    
+    Scrape stock data for a single symbol.
+
+    Thin wrapper over the batch path; prefer scrape_stock_data_batch
+    when more than one symbol is due.
+
     Args:
         symbol: Stock symbol to scrape
-        
+
     Returns:
         Dict containing scraped data
     """
-    # TODO: Implement actual scraping logic
-    return {
-        "symbol": symbol,
-        "status": "success",
-        "message": "Stock data scraping not yet implemented"
-    }
+    batch = scrape_stock_data_batch([symbol])
+    result = batch["results"][symbol]
+    return {"symbol": symbol, **result}
+
+@shared_task(bind=True, name="scraping.scrape_all_stocks")
+def scrape_all_stocks(self) -> Dict[str, Any]:
+    """
+    Dispatch batch scrapes covering every active stock.
+
+    Beat entry point: reads the active symbols once and fans out one
+    scrape_stock_data_batch task per _BATCH_SIZE symbols, so the
+    scraping workers share the load without a task per symbol.
+
+    Returns:
+        Dict with the number of symbols and batches dispatched
+    """
+    try:
+        with get_db_context() as db:
+            symbols = db.scalars(
+                select(Stock.symbol)
+                .where(Stock.is_active.is_(True))
+                .order_by(Stock.symbol)
+            ).all()
+
+        batches = 0
+        for start in range(0, len(symbols), _BATCH_SIZE):
+            scrape_stock_data_batch.delay(list(symbols[start:start + _BATCH_SIZE]))
+            batches += 1
+
+        logger.info("Stock scrape dispatched", symbols=len(symbols), batches=batches)
+        return {"status": "success", "symbols": len(symbols), "batches": batches}
+    except Exception as e:
+        logger.error("Error dispatching stock scrape", error=str(e))
+        raise
 
 @shared_task(bind=True, name="scraping.scrape_market_data")
 def scrape_market_data(self) -> Dict[str, Any]:
     """
     Scrape general market data.
-    
+
     Returns:
         Dict containing market data
     """
@@ -3,11 +3,23 @@ Celery application configuration for Dashboard Finance
 """
 
 import os
+import orjson
 from celery import Celery
 from celery.schedules import crontab
+from kombu.serialization import register
 
 from app.core.config import settings
 
+# C-implemented task payload (de)serialization; stdlib json's pure-Python
+# tokenizer otherwise sits on the hot path of every enqueue and result store
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Create Celery instance
 celery_app = Celery(
     "dashboard-finance",
@@ -21,28 +33,38 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    # Task routing
+    # Task routing. Patterns match registered task names (the explicit
+    # name="scraping..."/"maintenance..." given to @shared_task), not
+    # module paths; anything unmatched lands on the default queue, which
+    # the maintenance worker also consumes.
+    task_default_queue="default",
     task_routes={
-        "app.tasks.scraping.*": {"queue": "scraping"},
-        "app.tasks.maintenance.*": {"queue": "maintenance"},
-        "app.tasks.*": {"queue": "default"},
+        "scraping.*": {"queue": "scraping"},
+        "maintenance.*": {"queue": "maintenance"},
     },
     
-    # Task serialization
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Task serialization; plain json stays accepted so in-flight messages
+    # from pre-orjson producers still decode during rollout
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
     enable_utc=True,
     
-    # Task execution
+    # Task execution. Nothing in the app reads scraping/maintenance task
+    # results, so skip the backend write (one Redis RTT) per task by
+    # default; tasks whose return value a caller awaits must opt in with
+    # @shared_task(ignore_result=False).
     task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
     task_eager_propagates=True,
-    task_ignore_result=False,
-    task_store_errors_even_if_ignored=True,
+    task_ignore_result=True,
     
-    # Worker configuration
-    worker_prefetch_multiplier=1,
+    # Worker configuration. Prefetch is settings-driven: the default of 4
+    # keeps short scraping tasks flowing without a broker round-trip per
+    # completion; long-task workers (maintenance queue) should pass
+    # --prefetch-multiplier=1 on the command line instead. acks_late below
+    # redelivers prefetched-but-unprocessed tasks if a worker dies.
+    worker_prefetch_multiplier=settings.CELERY_PREFETCH_MULTIPLIER,
     worker_max_tasks_per_child=1000,
     worker_disable_rate_limits=False,
     
@@ -54,28 +76,21 @@ celery_app.conf.update(
     beat_schedule={
         # Scrape stock data every 5 minutes during market hours
         "scrape-stock-data": {
-            "task": "app.tasks.scraping.stock_scraping.scrape_all_stocks",
+            "task": "scraping.scrape_all_stocks",
             "schedule": crontab(minute="*/5", hour="9-17"),  # 9 AM to 5 PM
             "options": {"queue": "scraping"},
         },
-        
+
         # Clean up old data daily at 2 AM
         "cleanup-old-data": {
-            "task": "app.tasks.maintenance.cleanup.cleanup_old_data",
+            "task": "maintenance.cleanup_old_data",
             "schedule": crontab(hour=2, minute=0),
             "options": {"queue": "maintenance"},
         },
-        
-        # Health check every 10 minutes
-        "health-check": {
-            "task": "app.tasks.maintenance.health_check",
-            "schedule": crontab(minute="*/10"),
-            "options": {"queue": "maintenance"},
-        },
-        
-        # Update market indices every hour
-        "update-market-indices": {
-            "task": "app.tasks.scraping.stock_scraping.update_market_indices",
+
+        # Update market data every hour
+        "update-market-data": {
+            "task": "scraping.scrape_market_data",
             "schedule": crontab(minute=0),
             "options": {"queue": "scraping"},
         },
@@ -103,28 +118,23 @@ celery_app.conf.update(
 
 # Task annotations for specific tasks
 celery_app.conf.task_annotations = {
-    "app.tasks.scraping.stock_scraping.scrape_all_stocks": {
+    "scraping.scrape_all_stocks": {
         "rate_limit": "10/m",  # Max 10 tasks per minute
         "time_limit": 300,     # 5 minutes timeout
     },
-    "app.tasks.scraping.stock_scraping.update_market_indices": {
+    "scraping.scrape_market_data": {
         "rate_limit": "1/h",   # Max 1 task per hour
         "time_limit": 600,     # 10 minutes timeout
     },
-    "app.tasks.maintenance.cleanup.cleanup_old_data": {
+    "maintenance.cleanup_old_data": {
         "rate_limit": "1/d",   # Max 1 task per day
         "time_limit": 1800,    # 30 minutes timeout
     },
 }
 
-# Task routing for different environments
 if settings.ENVIRONMENT == "development":
-    # In development, route all tasks to default queue
-    celery_app.conf.task_routes = {
-        "app.tasks.*": {"queue": "default"},
-    }
-    
-    # Disable rate limiting in development
+    # Disable rate limiting in development; routing stays the same so the
+    # per-queue workers in docker-compose see the same traffic as prod
     celery_app.conf.task_annotations = {}
 
 # Optional: Configure result backend for different environments
@@ -134,6 +144,32 @@ if settings.ENVIRONMENT == "production":
         worker_max_tasks_per_child=500,  # Lower in production
     )
 
+# Per-worker-process resource lifecycle
+from celery.signals import worker_process_init, worker_process_shutdown
+
+
+@worker_process_init.connect
+def init_worker_process(**_):
+    """Reset pooled resources after prefork.
+
+    Children inherit the parent's SQLAlchemy pool whose sockets would be
+    shared across processes; dispose so each worker builds its own. The
+    shared HTTP client in the scraping tasks is created lazily per worker
+    on first use.
+    """
+    from app.core.database import engine
+    engine.dispose()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**_):
+    """Close the worker's shared HTTP client and connections cleanly"""
+    from app.core.database import engine
+    from app.tasks.scraping.stock_scraping import close_http_client
+    close_http_client()
+    engine.dispose()
+
+
 # Task error handling
 @celery_app.task(bind=True)
 def debug_task(self):
@@ -143,7 +179,7 @@ def debug_task(self):
 # Health check task
 @celery_app.task
 def health_check():
-    """Periodic health check task"""
+    """On-demand health check task"""
     return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
 
 if __name__ == "__main__":
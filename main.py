@@ -11,7 +11,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse, Response
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
 import structlog
 
 from app.core.config import settings
@@ -19,16 +19,51 @@ from app.core.logging import setup_logging
 from app.core.metrics import REQUEST_COUNT, REQUEST_LATENCY
 from app.api.v1.api import api_router
 
+# Use uvloop for the event loop when available (ships with uvicorn[standard]).
+# All handlers are I/O-bound, so the faster loop lowers per-request latency.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Setup logging
 setup_logging()
 logger = structlog.get_logger()
 
+
+def _build_metrics_registry():
+    """Registry for /metrics: aggregates across Gunicorn/Uvicorn workers
+    when PROMETHEUS_MULTIPROC_DIR is set, else the process-local default"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+
+    from prometheus_client import REGISTRY
+    return REGISTRY
+
+
+_metrics_registry = _build_metrics_registry()
+
+# Rendering the exposition text re-walks every sample; coalesce concurrent
+# scrapes behind a short-lived cache of the rendered bytes
+_METRICS_CACHE_SECONDS = 2.0
+_metrics_cache: tuple[float, bytes] = (0.0, b"")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info("Starting Dashboard Finance application")
-    
+
+    # Compile all mappers up front so the first request pays no configure cost
+    import app.models  # noqa: F401  (registers every model on the shared Base)
+    from app.core.database import Base
+    Base.registry.configure()
+
     # Import and initialize services here
     # await init_database()
     # await init_redis()
@@ -38,9 +73,79 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Dashboard Finance application")
-    # await close_database()
+
+    # Close pooled connections deterministically instead of at GC time
+    from app.core.database import engine
+    engine.dispose()
     # await close_redis()
 
+class MetricsMiddleware:
+    """Raw ASGI middleware recording request metrics and access logs.
+
+    Skips Starlette's BaseHTTPMiddleware plumbing (per-request Request
+    wrapper, task group, response re-streaming): only the
+    http.response.start message is inspected for the status code, and
+    timing uses the monotonic perf_counter.
+    """
+
+    # Probe traffic: /health is hit by liveness checks every few seconds
+    # and /metrics by the Prometheus scraper; instrumenting them burns CPU
+    # on the app's highest-QPS paths and feeds the scrape back into its
+    # own metrics
+    EXCLUDED_PATHS = frozenset({"/health", "/metrics"})
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency = time.perf_counter() - start_time
+            method = scope["method"]
+
+            # The router sets scope["route"] while handling the request;
+            # label with its template so cardinality stays bounded
+            route = scope.get("route")
+            endpoint = route.path if route is not None else "unmatched"
+
+            REQUEST_COUNT.labels(
+                method=method,
+                endpoint=endpoint,
+                status=status_code
+            ).inc()
+
+            REQUEST_LATENCY.labels(
+                method=method,
+                endpoint=endpoint
+            ).observe(latency)
+
+            headers = dict(scope["headers"])
+            client = scope.get("client")
+            logger.info(
+                "HTTP request",
+                method=method,
+                path=scope["path"],
+                status_code=status_code,
+                latency=latency,
+                user_agent=(headers.get(b"user-agent") or b"").decode("latin-1") or None,
+                client_ip=client[0] if client else None,
+            )
+
+
 def create_application() -> FastAPI:
     """Create and configure FastAPI application"""
     
@@ -64,43 +169,10 @@ def create_application() -> FastAPI:
     )
     
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
-    
-    # Add request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate latency
-        latency = time.time() - start_time
-        
-        # Record metrics
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code
-        ).inc()
-        
-        REQUEST_LATENCY.labels(
-            method=request.method,
-            endpoint=request.url.path
-        ).observe(latency)
-        
-        # Log request
-        logger.info(
-            "HTTP request",
-            method=request.method,
-            url=str(request.url),
-            status_code=response.status_code,
-            latency=latency,
-            user_agent=request.headers.get("user-agent"),
-            client_ip=request.client.host if request.client else None,
-        )
-        
-        return response
-    
+
+    # Request metrics + access logging as raw ASGI middleware
+    app.add_middleware(MetricsMiddleware)
+
     # Add exception handler
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
@@ -123,19 +195,30 @@ def create_application() -> FastAPI:
     @app.get("/health")
     async def health_check() -> dict[str, Any]:
         """Health check endpoint for monitoring"""
+        from app.core.database import engine
+
         return {
             "status": "healthy",
             "app": settings.APP_NAME,
             "version": settings.APP_VERSION,
             "environment": settings.ENVIRONMENT,
+            "database_pool": engine.pool.status(),
         }
     
     # Prometheus metrics endpoint
     @app.get("/metrics")
     async def metrics():
         """Prometheus metrics endpoint for monitoring"""
+        global _metrics_cache
+
+        rendered_at, payload = _metrics_cache
+        now = time.monotonic()
+        if now - rendered_at > _METRICS_CACHE_SECONDS or not payload:
+            payload = generate_latest(_metrics_registry)
+            _metrics_cache = (now, payload)
+
         return Response(
-            content=generate_latest(),
+            content=payload,
             media_type=CONTENT_TYPE_LATEST
         )
     
@@ -156,12 +239,23 @@ app = create_application()
 
 if __name__ == "__main__":
     import uvicorn
-    import time
-    
+
+    # Prefer the C event loop and HTTP parser (uvicorn[standard] extras);
+    # fall back to asyncio/h11 where the wheels are unavailable
+    try:
+        import uvloop  # noqa: F811
+        import httptools  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "auto", "auto"
+
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.RELOAD,
+        workers=1 if settings.RELOAD else settings.WORKERS,
+        loop=loop,
+        http=http,
         log_level="info" if settings.DEBUG else "warning",
     )
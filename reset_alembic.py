@@ -3,27 +3,42 @@
 Reset Alembic and recreate tables
 """
 
+import sys
+
+from app.core.config import settings
 from app.core.database import engine, drop_tables, create_tables
 from sqlalchemy import text
 
 def main():
-    print("Resetting Alembic and database...")
-    
-    # Drop alembic version table
-    with engine.connect() as conn:
-        conn.execute(text("DROP TABLE IF EXISTS alembic_version CASCADE"))
-        conn.commit()
-        print("✅ Alembic version table dropped")
-    
-    # Drop all tables
-    drop_tables()
-    print("✅ All tables dropped")
-    
+    # Hard stop in production: this wipes every table in the database
+    if settings.ENVIRONMENT == "production":
+        sys.stderr.write("Refusing to reset the database in production.\n")
+        sys.exit(1)
+
+    # Collect progress lines and flush once instead of a write per print
+    lines = ["Resetting Alembic and database..."]
+
+    if engine.dialect.name == "postgresql":
+        # Recreating the schema drops every table, sequence and the
+        # alembic_version bookkeeping in one statement, instead of a
+        # DROP TABLE round-trip per table in dependency order
+        with engine.begin() as conn:
+            conn.execute(text("DROP SCHEMA public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+        lines.append("✅ Schema dropped and recreated")
+    else:
+        with engine.connect() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+            conn.commit()
+        drop_tables()
+        lines.append("✅ All tables dropped")
+
     # Recreate all tables
     create_tables()
-    print("✅ All tables recreated")
-    
-    print("🎉 Database reset completed!")
+    lines.append("✅ All tables recreated")
+
+    lines.append("🎉 Database reset completed!")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
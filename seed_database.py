@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
+from app.core.logging import _orjson_dumps
 from app.seeders.main_seeder import MainSeeder
 import structlog
 
@@ -25,7 +26,8 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        # orjson renders events at C speed instead of stdlib json
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -80,42 +82,65 @@ def main():
 def display_summary(db: Session):
     """Display a summary of the seeded data"""
     try:
+        from sqlalchemy import func, select
+
         from app.models.user import User
         from app.models.stock import Stock
         from app.models.stock_price import StockPrice
         from app.models.user_portfolio import UserPortfolio
         from app.models.watchlist import Watchlist, WatchlistItem
+
+        # One SELECT of scalar subqueries instead of six serial COUNT
+        # round-trips
+        (
+            user_count,
+            stock_count,
+            price_count,
+            portfolio_count,
+            watchlist_count,
+            watchlist_item_count,
+        ) = db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(Stock.id)).scalar_subquery(),
+                select(func.count(StockPrice.id)).scalar_subquery(),
+                select(func.count(UserPortfolio.id)).scalar_subquery(),
+                select(func.count(Watchlist.id)).scalar_subquery(),
+                select(func.count(WatchlistItem.id)).scalar_subquery(),
+            )
+        ).one()
         
-        user_count = db.query(User).count()
-        stock_count = db.query(Stock).count()
-        price_count = db.query(StockPrice).count()
-        portfolio_count = db.query(UserPortfolio).count()
-        watchlist_count = db.query(Watchlist).count()
-        watchlist_item_count = db.query(WatchlistItem).count()
-        
-        print("\n" + "="*60)
-        print("🎉 DATABASE SEEDING SUMMARY")
-        print("="*60)
-        print(f"👥 Users created: {user_count}")
-        print(f"📈 Stocks created: {stock_count}")
-        print(f"💰 Stock prices created: {price_count}")
-        print(f"💼 Portfolio positions: {portfolio_count}")
-        print(f"👀 Watchlists created: {watchlist_count}")
-        print(f"📋 Watchlist items: {watchlist_item_count}")
-        print("="*60)
-        
-        # Display user credentials
-        print("\n🔑 TEST USER CREDENTIALS:")
-        print("-" * 40)
+        # Build the whole report in memory and flush it with one write;
+        # line-buffered print() would issue a syscall per line
+        lines = [
+            "",
+            "=" * 60,
+            "🎉 DATABASE SEEDING SUMMARY",
+            "=" * 60,
+            f"👥 Users created: {user_count}",
+            f"📈 Stocks created: {stock_count}",
+            f"💰 Stock prices created: {price_count}",
+            f"💼 Portfolio positions: {portfolio_count}",
+            f"👀 Watchlists created: {watchlist_count}",
+            f"📋 Watchlist items: {watchlist_item_count}",
+            "=" * 60,
+            "",
+            "🔑 TEST USER CREDENTIALS:",
+            "-" * 40,
+        ]
+
         users = db.query(User).all()
         for user in users:
-            print(f"Username: {user.username}")
-            print(f"Email: {user.email}")
-            print(f"Password: password123")
-            print(f"Role: {user.role.value}")
-            print("-" * 40)
-        
-        print("\n🚀 You can now test the application with these credentials!")
+            lines += [
+                f"Username: {user.username}",
+                f"Email: {user.email}",
+                "Password: password123",
+                f"Role: {user.role.value}",
+                "-" * 40,
+            ]
+
+        lines += ["", "🚀 You can now test the application with these credentials!"]
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         logger.error("Error displaying summary", error=str(e))